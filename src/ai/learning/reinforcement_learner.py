@@ -54,7 +54,7 @@ class ReinforcementLearner:
     def get_state_key(self, state: List[float]) -> Tuple:
         """Convert continuous state to discrete key"""
         # Discretize state for Q-table lookup
-        return tuple(round(s, 2) for s in state)
+        return tuple([round(s, 2) for s in state])
         
     def get_action(self, state: List[float], training: bool = True) -> int:
         """
@@ -70,15 +70,16 @@ class ReinforcementLearner:
         state_key = self.get_state_key(state)
         
         # Initialize Q-values if state not seen
-        if state_key not in self.q_table:
-            self.q_table[state_key] = [0.0] * self.action_dim
+        q_values = self.q_table.get(state_key)
+        if q_values is None:
+            q_values = self.q_table[state_key] = [0.0] * self.action_dim
             
         # Epsilon-greedy exploration
         if training and random.random() < self.epsilon:
             return random.randint(0, self.action_dim - 1)
         else:
             # Exploit: choose best action
-            return self.q_table[state_key].index(max(self.q_table[state_key]))
+            return q_values.index(max(q_values))
             
     def store_experience(self, state: List[float], action: int, 
                         reward: float, next_state: List[float], done: bool) -> None:
@@ -129,28 +130,31 @@ class ReinforcementLearner:
         Returns:
             TD error (similar to dopamine signal)
         """
+        q_table = self.q_table
         state_key = self.get_state_key(state)
         next_state_key = self.get_state_key(next_state)
         
-        # Initialize if needed
-        if state_key not in self.q_table:
-            self.q_table[state_key] = [0.0] * self.action_dim
-        if next_state_key not in self.q_table:
-            self.q_table[next_state_key] = [0.0] * self.action_dim
+        # Initialize if needed; each row is looked up once
+        q_values = q_table.get(state_key)
+        if q_values is None:
+            q_values = q_table[state_key] = [0.0] * self.action_dim
+        next_q_values = q_table.get(next_state_key)
+        if next_q_values is None:
+            next_q_values = q_table[next_state_key] = [0.0] * self.action_dim
             
         # Calculate TD error (reward prediction error)
-        current_q = self.q_table[state_key][action]
+        current_q = q_values[action]
         
         if done:
             target_q = reward
         else:
-            max_next_q = max(self.q_table[next_state_key])
+            max_next_q = max(next_q_values)
             target_q = reward + self.gamma * max_next_q
             
         td_error = target_q - current_q
         
         # Update Q-value
-        self.q_table[state_key][action] += self.learning_rate * td_error
+        q_values[action] += self.learning_rate * td_error
         
         self.total_updates += 1
         
@@ -15,180 +15,138 @@ Real neural network implementation with biological characteristics:
 - Neurogenesis simulation
 """
 
+import bisect
 import math
+import os
 import random
 from typing import List, Dict, Tuple, Optional, Any
 import json
 
+import numpy as np
+
+# Number of most recent spikes per neuron paired up by STDP
+STDP_SPIKE_HISTORY = 5
+
+# Floating-point type for membrane, synapse and firing-rate state. Spike and
+# arrival times stay float64 because they accumulate over the whole run.
+# THALOS_PRECISION selects float16, float32 (default) or float64.
+_PRECISIONS = {"float16": np.float16, "float32": np.float32, "float64": np.float64}
+STATE_DTYPE = np.dtype(_PRECISIONS.get(os.environ.get("THALOS_PRECISION", "float32"), np.float32))
+
+
+def _lif_update(v: np.ndarray, resting: np.ndarray, leak: np.ndarray,
+                capacitance: np.ndarray, threshold: np.ndarray,
+                synaptic_current: np.ndarray, ready: np.ndarray,
+                dt: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Leaky integrate-and-fire update for every neuron
+    
+    Args:
+        v: Membrane potentials
+        resting: Resting potentials
+        leak: Leak conductances
+        capacitance: Membrane capacitances
+        threshold: Firing thresholds
+        synaptic_current: Summed synaptic input per neuron
+        ready: Mask of neurons outside their refractory period
+        dt: Time step (ms), in the state dtype
+        
+    Returns:
+        Updated membrane potentials and ids of neurons that fired
+    """
+    leak_current = -leak * (v - resting)
+    dv = (synaptic_current + leak_current) / capacitance
+    v = np.where(ready, v + dv * dt, v)
+    fired = np.flatnonzero(ready & (v >= threshold))
+    return v, fired
+
 
 class Neuron:
     """
-    Spiking neuron model with biological properties
+    Parameter handle for one neuron of a BioNeuralNetwork
+    
+    The network keeps all live neuron state (membrane potential, spike
+    history, thresholds after homeostasis) in its arrays, indexed by
+    neuron_id. The attributes here only seed those arrays when the layer is
+    created and are not updated by the simulation.
     """
     
     def __init__(self, neuron_id: int, neuron_type: str = "excitatory"):
         self.neuron_id = neuron_id
         self.neuron_type = neuron_type  # excitatory or inhibitory
         
-        # Membrane potential
-        self.membrane_potential = -70.0  # mV (resting potential)
+        # Initial membrane parameters
+        self.initial_potential = -70.0  # mV (resting potential)
         self.threshold = -55.0  # mV (firing threshold)
         self.resting_potential = -70.0  # mV
         self.reset_potential = -75.0  # mV
-        
-        # Synaptic inputs
-        self.incoming_synapses: List['Synapse'] = []
-        self.outgoing_synapses: List['Synapse'] = []
-        
-        # Spike history
-        self.spike_times: List[float] = []
         self.refractory_period = 2.0  # ms
-        self.last_spike_time = -float('inf')
         
         # Biological properties
         self.leak_conductance = 0.1
         self.capacitance = 1.0
-        
-    def update(self, dt: float, current_time: float) -> bool:
-        """
-        Update neuron state (Leaky Integrate-and-Fire model)
-        
-        Args:
-            dt: Time step in ms
-            current_time: Current simulation time
-            
-        Returns:
-            bool: True if neuron fired a spike
-        """
-        # Check refractory period
-        if current_time - self.last_spike_time < self.refractory_period:
-            return False
-            
-        # Sum synaptic inputs
-        synaptic_current = sum(syn.get_current() for syn in self.incoming_synapses)
-        
-        # Leak current (towards resting potential)
-        leak_current = -self.leak_conductance * (self.membrane_potential - self.resting_potential)
-        
-        # Update membrane potential (dV/dt = (I_syn + I_leak) / C)
-        dv = (synaptic_current + leak_current) / self.capacitance
-        self.membrane_potential += dv * dt
-        
-        # Check for spike
-        if self.membrane_potential >= self.threshold:
-            self._fire_spike(current_time)
-            return True
-            
-        return False
-        
-    def _fire_spike(self, time: float) -> None:
-        """Generate action potential"""
-        self.spike_times.append(time)
-        self.last_spike_time = time
-        self.membrane_potential = self.reset_potential
-        
-        # Propagate spike to outgoing synapses
-        for synapse in self.outgoing_synapses:
-            synapse.receive_spike(time)
-            
-    def add_incoming_synapse(self, synapse: 'Synapse') -> None:
-        """Add incoming synaptic connection"""
-        self.incoming_synapses.append(synapse)
-        
-    def add_outgoing_synapse(self, synapse: 'Synapse') -> None:
-        """Add outgoing synaptic connection"""
-        self.outgoing_synapses.append(synapse)
-        
-    def get_firing_rate(self, time_window: float = 1000.0) -> float:
-        """Calculate firing rate in Hz over time window"""
-        if not self.spike_times:
-            return 0.0
-        recent_spikes = [t for t in self.spike_times if t > (self.spike_times[-1] - time_window)]
-        return len(recent_spikes) / (time_window / 1000.0)
 
 
-class Synapse:
+class BioNeuralNetwork:
     """
-    Synaptic connection with plasticity
+    Biologically-inspired neural network with spiking neurons
+    
+    Neuron and synapse state is held in flat NumPy arrays (structure of arrays)
+    so each simulation step updates the whole network with a handful of
+    vectorized operations. Neurons returned by create_layer are handles whose
+    neuron_id indexes those arrays; their per-object parameters seed the
+    network state when the layer is created.
     """
     
-    def __init__(self, pre_neuron: Neuron, post_neuron: Neuron, 
-                 initial_weight: float = 0.5):
-        self.pre_neuron = pre_neuron
-        self.post_neuron = post_neuron
-        self.weight = initial_weight
-        
-        # STDP parameters
-        self.a_plus = 0.01  # LTP amplitude
-        self.a_minus = 0.01  # LTD amplitude
-        self.tau_plus = 20.0  # LTP time constant (ms)
-        self.tau_minus = 20.0  # LTD time constant (ms)
-        
-        # Synaptic dynamics
-        self.delay = 1.0  # ms
-        self.pending_spikes: List[float] = []
-        self.current = 0.0
-        self.decay_rate = 0.9
-        
-    def receive_spike(self, time: float) -> None:
-        """Receive spike from presynaptic neuron"""
-        arrival_time = time + self.delay
-        self.pending_spikes.append(arrival_time)
-        
-    def update(self, dt: float, current_time: float) -> None:
-        """Update synaptic current"""
-        # Decay current
-        self.current *= math.exp(-self.decay_rate * dt)
-        
-        # Process pending spikes
-        spikes_to_remove = []
-        for spike_time in self.pending_spikes:
-            if current_time >= spike_time:
-                # Add synaptic current
-                self.current += self.weight
-                spikes_to_remove.append(spike_time)
-                
-        # Remove processed spikes
-        for spike_time in spikes_to_remove:
-            self.pending_spikes.remove(spike_time)
-            
-    def get_current(self) -> float:
-        """Get current synaptic current"""
-        return self.current
-        
-    def apply_stdp(self, dt_pre_post: float) -> None:
+    def __init__(self, name: str = "bio_net", dtype: Optional[Any] = None):
         """
-        Apply Spike-Timing-Dependent Plasticity
+        Initialize an empty network
         
         Args:
-            dt_pre_post: Time difference (post_spike - pre_spike) in ms
+            name: Network name
+            dtype: Floating-point type for neuron and synapse state
+                (default STATE_DTYPE)
         """
-        if dt_pre_post > 0:
-            # LTP (Long-Term Potentiation) - strengthen synapse
-            delta_w = self.a_plus * math.exp(-dt_pre_post / self.tau_plus)
-        else:
-            # LTD (Long-Term Depression) - weaken synapse
-            delta_w = -self.a_minus * math.exp(dt_pre_post / self.tau_minus)
-            
-        # Update weight with bounds
-        self.weight = max(0.0, min(1.0, self.weight + delta_w))
-
-
-class BioNeuralNetwork:
-    """
-    Biologically-inspired neural network with spiking neurons
-    """
-    
-    def __init__(self, name: str = "bio_net"):
         self.name = name
+        self.dtype = np.dtype(dtype) if dtype is not None else STATE_DTYPE
         self.neurons: List[Neuron] = []
-        self.synapses: List[Synapse] = []
         
         # Network structure
         self.input_neurons: List[Neuron] = []
         self.hidden_neurons: List[Neuron] = []
         self.output_neurons: List[Neuron] = []
         
+        # Neuron state (one entry per neuron)
+        self._v = np.empty(0, dtype=self.dtype)
+        self._threshold = np.empty(0, dtype=self.dtype)
+        self._resting = np.empty(0, dtype=self.dtype)
+        self._reset_potential = np.empty(0, dtype=self.dtype)
+        self._leak = np.empty(0, dtype=self.dtype)
+        self._capacitance = np.empty(0, dtype=self.dtype)
+        self._refractory = np.empty(0)
+        self._last_spike = np.empty(0)
+        self._firing_rate = np.empty(0, dtype=self.dtype)  # Hz over the 1s window ending at the last spike
+        self._threshold_drift: Optional[np.ndarray] = None  # Homeostatic step, rebuilt when rates change
+        self._recent_spikes = np.empty((0, STDP_SPIKE_HISTORY))
+        self._spike_times: List[List[float]] = []
+        
+        # Synapse state (one entry per synapse)
+        self._pre = np.empty(0, dtype=np.intp)
+        self._post = np.empty(0, dtype=np.intp)
+        self._weights = np.empty(0, dtype=self.dtype)
+        self._currents = np.empty(0, dtype=self.dtype)
+        self._arrival = np.empty(0)  # Pending spike arrival time, inf if none
+        
+        # Synaptic dynamics
+        self.synaptic_delay = 1.0  # ms
+        self.synaptic_decay_rate = 0.9
+        
+        # STDP parameters
+        self.a_plus = 0.01  # LTP amplitude
+        self.a_minus = 0.01  # LTD amplitude
+        self.tau_plus = 20.0  # LTP time constant (ms)
+        self.tau_minus = 20.0  # LTD time constant (ms)
+        
         # Simulation state
         self.current_time = 0.0
         self.dt = 0.1  # Time step in ms
@@ -213,8 +171,27 @@ class BioNeuralNetwork:
             neuron_id = len(self.neurons)
             neuron = Neuron(neuron_id)
             self.neurons.append(neuron)
+            self._spike_times.append([])
             layer.append(neuron)
             
+        # Seed array state from the neuron parameters
+        def column(values: List[float]) -> np.ndarray:
+            return np.array(values, dtype=self.dtype)
+            
+        self._v = np.append(self._v, column([n.initial_potential for n in layer]))
+        self._threshold = np.append(self._threshold, column([n.threshold for n in layer]))
+        self._resting = np.append(self._resting, column([n.resting_potential for n in layer]))
+        self._reset_potential = np.append(self._reset_potential, column([n.reset_potential for n in layer]))
+        self._leak = np.append(self._leak, column([n.leak_conductance for n in layer]))
+        self._capacitance = np.append(self._capacitance, column([n.capacitance for n in layer]))
+        self._refractory = np.append(self._refractory, [n.refractory_period for n in layer])
+        self._last_spike = np.append(self._last_spike, np.full(num_neurons, -np.inf))
+        self._firing_rate = np.append(self._firing_rate, np.zeros(num_neurons, dtype=self.dtype))
+        self._threshold_drift = None
+        self._recent_spikes = np.vstack([
+            self._recent_spikes, np.full((num_neurons, STDP_SPIKE_HISTORY), np.nan)
+        ])
+            
         # Categorize neurons
         if layer_type == "input":
             self.input_neurons.extend(layer)
@@ -235,16 +212,21 @@ class BioNeuralNetwork:
             post_layer: Postsynaptic layer
             connection_probability: Probability of connection between neurons
         """
+        pre_ids, post_ids, weights = [], [], []
         for pre_neuron in pre_layer:
             for post_neuron in post_layer:
                 if random.random() < connection_probability:
                     # Random initial weight
-                    weight = random.uniform(0.3, 0.7)
-                    synapse = Synapse(pre_neuron, post_neuron, weight)
+                    pre_ids.append(pre_neuron.neuron_id)
+                    post_ids.append(post_neuron.neuron_id)
+                    weights.append(random.uniform(0.3, 0.7))
                     
-                    pre_neuron.add_outgoing_synapse(synapse)
-                    post_neuron.add_incoming_synapse(synapse)
-                    self.synapses.append(synapse)
+        count = len(weights)
+        self._pre = np.append(self._pre, np.array(pre_ids, dtype=np.intp))
+        self._post = np.append(self._post, np.array(post_ids, dtype=np.intp))
+        self._weights = np.append(self._weights, np.array(weights, dtype=self.dtype))
+        self._currents = np.append(self._currents, np.zeros(count, dtype=self.dtype))
+        self._arrival = np.append(self._arrival, np.full(count, np.inf))
                     
     def stimulate_inputs(self, input_pattern: List[float]) -> None:
         """
@@ -256,10 +238,9 @@ class BioNeuralNetwork:
         if len(input_pattern) != len(self.input_neurons):
             raise ValueError(f"Input pattern size {len(input_pattern)} doesn't match input layer size {len(self.input_neurons)}")
             
-        for neuron, intensity in zip(self.input_neurons, input_pattern):
-            # Convert intensity to current injection
-            current = intensity * 50.0  # Scale to appropriate range
-            neuron.membrane_potential += current
+        input_ids = [neuron.neuron_id for neuron in self.input_neurons]
+        # Convert intensity to current injection
+        self._v[input_ids] += np.asarray(input_pattern, dtype=self._v.dtype) * 50.0
             
     def simulate_step(self) -> Dict[str, Any]:
         """
@@ -268,63 +249,200 @@ class BioNeuralNetwork:
         Returns:
             Dict with simulation results
         """
-        # Update synapses
-        for synapse in self.synapses:
-            synapse.update(self.dt, self.current_time)
+        spikes = self._step(math.exp(-self.synaptic_decay_rate * self.dt)).tolist()
+        
+        return {
+            "time": self.current_time,
+            "spikes": spikes,
+            "num_spikes": len(spikes)
+        }
+        
+    def simulate_batch(self, n_steps: int) -> Dict[str, Any]:
+        """
+        Simulate several time steps in one call
+        
+        Per-step invariants (the synaptic decay factor) are computed once for
+        the whole batch.
+        
+        Args:
+            n_steps: Number of time steps to simulate
             
-        # Update neurons
-        spikes = []
-        for neuron in self.neurons:
-            if neuron.update(self.dt, self.current_time):
-                spikes.append(neuron.neuron_id)
-                
-        # Apply STDP if learning enabled
-        if self.learning_enabled and len(spikes) > 0:
-            self._apply_learning()
+        Returns:
+            Dict with simulation results; spikes lists every neuron id that
+            fired during the batch, in firing order
+        """
+        decay = math.exp(-self.synaptic_decay_rate * self.dt)
+        fired = [self._step(decay) for _ in range(n_steps)]
+        spikes = np.concatenate(fired).tolist() if fired else []
+        
+        return {
+            "time": self.current_time,
+            "steps": n_steps,
+            "spikes": spikes,
+            "num_spikes": len(spikes)
+        }
+        
+    def simulate_until_stable(self, max_steps: int = 50, check_interval: int = 5,
+                              tolerance: float = 1e-3, patience: int = 2) -> Dict[str, Any]:
+        """
+        Simulate up to max_steps, stopping early once the output has settled
+        
+        Every check_interval steps the output firing rates are compared with
+        the previous check. The run stops after `patience` consecutive checks
+        in which no rate moved by more than `tolerance` and no spike is still
+        in flight to a synapse, so pending activity is never cut off.
+        
+        Args:
+            max_steps: Step budget
+            check_interval: Steps between convergence checks
+            tolerance: Largest output rate change (Hz) treated as stable
+            patience: Consecutive stable checks required to stop
             
-        # Homeostatic regulation
-        if self.homeostasis_enabled:
-            self._apply_homeostasis()
+        Returns:
+            Dict with simulation results as for simulate_batch, plus whether
+            the run converged before exhausting the budget
+        """
+        decay = math.exp(-self.synaptic_decay_rate * self.dt)
+        fired = []
+        previous = None
+        stable_checks = 0
+        converged = False
+        
+        while len(fired) < max_steps:
+            fired.append(self._step(decay))
+            if len(fired) % check_interval:
+                continue
+                
+            current = np.array(self.get_output_activity())
+            if (previous is not None and np.isinf(self._arrival).all()
+                    and np.all(np.abs(current - previous) <= tolerance)):
+                stable_checks += 1
+                if stable_checks >= patience:
+                    converged = True
+                    break
+            else:
+                stable_checks = 0
+            previous = current
             
-        self.current_time += self.dt
+        spikes = np.concatenate(fired).tolist() if fired else []
         
         return {
             "time": self.current_time,
+            "steps": len(fired),
+            "converged": converged,
             "spikes": spikes,
             "num_spikes": len(spikes)
         }
         
+    def _step(self, decay: float) -> np.ndarray:
+        """
+        Advance the network by one time step
+        
+        Args:
+            decay: Synaptic current decay factor for one time step
+            
+        Returns:
+            Ids of neurons that fired
+        """
+        now = self.current_time
+        
+        # Update synapses: decay current, then deliver spikes that have arrived
+        self._currents *= decay
+        arrived = self._arrival <= now
+        if arrived.any():
+            self._currents[arrived] += self._weights[arrived]
+            self._arrival[arrived] = np.inf
+            
+        # Update neurons (Leaky Integrate-and-Fire), skipping refractory ones
+        ready = (now - self._last_spike) >= self._refractory
+        synaptic_current = np.bincount(self._post, weights=self._currents,
+                                       minlength=len(self._v)).astype(self.dtype, copy=False)
+        self._v, fired = _lif_update(self._v, self._resting, self._leak, self._capacitance,
+                                     self._threshold, synaptic_current, ready,
+                                     self.dtype.type(self.dt))
+        if fired.size:
+            self._fire(fired, now)
+            
+            # Apply STDP if learning enabled
+            if self.learning_enabled:
+                self._apply_learning()
+                
+        # Homeostatic regulation
+        if self.homeostasis_enabled:
+            self._apply_homeostasis()
+            
+        self.current_time += self.dt
+        return fired
+        
+    def _fire(self, fired: np.ndarray, time: float) -> None:
+        """Generate action potentials for the given neurons"""
+        self._last_spike[fired] = time
+        self._v[fired] = self._reset_potential[fired]
+        
+        # Shift the spike into each neuron's recent-spike window
+        self._recent_spikes[fired, :-1] = self._recent_spikes[fired, 1:]
+        self._recent_spikes[fired, -1] = time
+        
+        for neuron_id in fired.tolist():
+            spike_times = self._spike_times[neuron_id]
+            spike_times.append(time)
+            # The 1s firing-rate window is anchored at the last spike, so it
+            # only changes when the neuron fires
+            self._firing_rate[neuron_id] = self._count_recent(spike_times, 1000.0)
+        self._threshold_drift = None
+            
+        # Propagate spikes to outgoing synapses; the refractory period outlasts
+        # the synaptic delay, so each synapse has at most one spike in flight
+        self._arrival[np.isin(self._pre, fired)] = time + self.synaptic_delay
+        
+    @staticmethod
+    def _count_recent(spike_times: List[float], time_window: float) -> float:
+        """Firing rate in Hz over the window ending at the last spike"""
+        if not spike_times:
+            return 0.0
+        start = bisect.bisect_right(spike_times, spike_times[-1] - time_window)
+        return (len(spike_times) - start) / (time_window / 1000.0)
+        
     def _apply_learning(self) -> None:
         """Apply STDP learning to all synapses"""
-        for synapse in self.synapses:
-            pre_spikes = synapse.pre_neuron.spike_times
-            post_spikes = synapse.post_neuron.spike_times
+        # Pair the last spikes of each synapse's pre and post neurons
+        pre_times = self._recent_spikes[self._pre][:, :, None]
+        post_times = self._recent_spikes[self._post][:, None, :]
+        dt = post_times - pre_times
+        
+        # Missing spikes are NaN and fall outside the STDP window
+        with np.errstate(invalid='ignore'):
+            in_window = np.abs(dt) < 50.0
+        if not in_window.any():
+            return
             
-            if not pre_spikes or not post_spikes:
-                continue
-                
-            # Find closest spike pairs
-            for pre_time in pre_spikes[-5:]:  # Last 5 spikes
-                for post_time in post_spikes[-5:]:
-                    dt = post_time - pre_time
-                    if abs(dt) < 50.0:  # Within STDP window
-                        synapse.apply_stdp(dt)
+        dt = np.where(in_window, dt, 0.0)
+        # LTP (Long-Term Potentiation) for causal pairs, LTD (Long-Term Depression) otherwise
+        delta_w = np.where(dt > 0,
+                           self.a_plus * np.exp(-dt / self.tau_plus),
+                           -self.a_minus * np.exp(dt / self.tau_minus))
+        delta_w = np.where(in_window, delta_w, 0.0).sum(axis=(1, 2)).astype(self.dtype)
+        
+        # Update weights with bounds
+        np.clip(self._weights + delta_w, 0.0, 1.0, out=self._weights)
                         
     def _apply_homeostasis(self) -> None:
         """Apply homeostatic regulation to maintain network stability"""
-        target_rate = 5.0  # Target firing rate in Hz
-        
-        for neuron in self.neurons:
-            current_rate = neuron.get_firing_rate(1000.0)
+        # Firing rates only change when a neuron fires, so the per-step
+        # threshold adjustment is rebuilt only then
+        if self._threshold_drift is None:
+            target_rate = 5.0  # Target firing rate in Hz
+            step = self.dtype.type(0.1)
+            self._threshold_drift = np.where(
+                self._firing_rate > target_rate * 1.5, step,
+                np.where(self._firing_rate < target_rate * 0.5, -step, 0)
+            ).astype(self.dtype, copy=False)
             
-            # Adjust threshold to regulate firing rate
-            if current_rate > target_rate * 1.5:
-                neuron.threshold += 0.1  # Increase threshold (harder to fire)
-            elif current_rate < target_rate * 0.5:
-                neuron.threshold -= 0.1  # Decrease threshold (easier to fire)
-                
-            # Keep threshold in reasonable range
-            neuron.threshold = max(-60.0, min(-50.0, neuron.threshold))
+        # Adjust threshold to regulate firing rate
+        self._threshold += self._threshold_drift
+        
+        # Keep threshold in reasonable range
+        np.clip(self._threshold, -60.0, -50.0, out=self._threshold)
             
     def get_output_activity(self) -> List[float]:
         """
@@ -333,7 +451,8 @@ class BioNeuralNetwork:
         Returns:
             List of firing rates for output neurons
         """
-        return [neuron.get_firing_rate(100.0) for neuron in self.output_neurons]
+        return [self._count_recent(self._spike_times[neuron.neuron_id], 100.0)
+                for neuron in self.output_neurons]
         
     def train(self, input_patterns: List[List[float]], 
              target_outputs: List[List[float]], epochs: int = 100) -> Dict[str, Any]:
@@ -361,8 +480,7 @@ class BioNeuralNetwork:
                 self.stimulate_inputs(input_pattern)
                 
                 # Simulate for processing time
-                for _ in range(100):  # 10ms simulation
-                    self.simulate_step()
+                self.simulate_batch(100)  # 10ms simulation
                     
                 # Get output
                 actual_output = self.get_output_activity()
@@ -387,23 +505,21 @@ class BioNeuralNetwork:
         Args:
             reward: Reward signal (0.0 to 1.0)
         """
-        # Modulate recent synaptic changes based on reward
-        for synapse in self.synapses:
-            # Strengthen recently active synapses if reward is high
-            if synapse.current > 0.1:  # Recently active
-                synapse.weight *= (1.0 + reward * 0.01)
-                synapse.weight = min(1.0, synapse.weight)
+        # Strengthen recently active synapses if reward is high
+        recently_active = self._currents > 0.1
+        self._weights[recently_active] = np.minimum(
+            1.0, self._weights[recently_active] * (1.0 + reward * 0.01))
                 
     def get_network_stats(self) -> Dict[str, Any]:
         """Get comprehensive network statistics"""
-        total_spikes = sum(len(n.spike_times) for n in self.neurons)
-        avg_firing_rate = sum(n.get_firing_rate() for n in self.neurons) / len(self.neurons) if self.neurons else 0
-        avg_weight = sum(s.weight for s in self.synapses) / len(self.synapses) if self.synapses else 0
+        total_spikes = sum(len(times) for times in self._spike_times)
+        avg_firing_rate = float(self._firing_rate.mean()) if self.neurons else 0
+        avg_weight = float(self._weights.mean()) if self._weights.size else 0
         
         return {
             "name": self.name,
             "num_neurons": len(self.neurons),
-            "num_synapses": len(self.synapses),
+            "num_synapses": int(self._weights.size),
             "current_time": self.current_time,
             "total_spikes": total_spikes,
             "avg_firing_rate": round(avg_firing_rate, 2),
@@ -416,9 +532,12 @@ class BioNeuralNetwork:
     def reset(self) -> None:
         """Reset network to initial state"""
         self.current_time = 0.0
-        for neuron in self.neurons:
-            neuron.membrane_potential = neuron.resting_potential
-            neuron.spike_times.clear()
-        for synapse in self.synapses:
-            synapse.current = 0.0
-            synapse.pending_spikes.clear()
+        self._v = self._resting.copy()
+        self._last_spike.fill(-np.inf)
+        self._firing_rate.fill(0.0)
+        self._threshold_drift = None
+        self._recent_spikes.fill(np.nan)
+        for spike_times in self._spike_times:
+            spike_times.clear()
+        self._currents.fill(0.0)
+        self._arrival.fill(np.inf)
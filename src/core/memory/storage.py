@@ -26,6 +26,43 @@ from typing import Any, Dict, Optional
 import json
 import os
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Same layout as json.dump(..., indent=2); keys are stringified the same way.
+# Types orjson would encode differently from json (subclasses, datetimes,
+# dataclasses) raise instead, so the snapshot falls back to json.dump
+_ORJSON_OPTIONS = (orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                   | orjson.OPT_PASSTHROUGH_SUBCLASS | orjson.OPT_PASSTHROUGH_DATETIME
+                   | orjson.OPT_PASSTHROUGH_DATACLASS) if ORJSON_AVAILABLE else 0
+
+
+def _orjson_snapshot(storage: Dict[str, Any]) -> Optional[bytes]:
+    """
+    Encode a snapshot with orjson when the result matches json.dump
+    
+    orjson raises on integers wider than 64 bits and writes NaN and
+    Infinity as null, where json.dump writes them verbatim. Any output
+    containing null is therefore left to json.dump as well; a literal None
+    or a string containing "null" only costs the slower encoder.
+    
+    Args:
+        storage: Store to encode
+        
+    Returns:
+        Encoded snapshot, or None if json.dump must write it
+    """
+    if not ORJSON_AVAILABLE:
+        return None
+    try:
+        payload = orjson.dumps(storage, option=_ORJSON_OPTIONS)
+    except TypeError:
+        return None
+    return None if b"null" in payload else payload
+
 
 class MemoryModule:
     """
@@ -69,6 +106,23 @@ class MemoryModule:
         self.storage[key] = value
         return True
         
+    def create_many(self, items: Dict[str, Any]) -> bool:
+        """
+        Create several new entries in one operation
+        
+        All-or-nothing: if any key already exists, nothing is stored.
+        
+        Args:
+            items: Mapping of unique identifiers to data
+            
+        Returns:
+            bool: True if all entries were created, False if any key already exists
+        """
+        if not self.storage.keys().isdisjoint(items):
+            return False
+        self.storage.update(items)
+        return True
+        
     def read(self, key: str) -> Optional[Any]:
         """
         Read data from storage (explicit CRUD - Read)
@@ -81,6 +135,15 @@ class MemoryModule:
         """
         return self.storage.get(key)
         
+    def read_all(self) -> Dict[str, Any]:
+        """
+        Read every entry in one operation
+        
+        Returns:
+            Shallow copy of storage; changing it does not change stored entries
+        """
+        return dict(self.storage)
+        
     def update(self, key: str, value: Any) -> bool:
         """
         Update existing data in storage (explicit CRUD - Update)
@@ -161,8 +224,13 @@ class MemoryModule:
             os.makedirs(os.path.dirname(self.persistence_path), exist_ok=True)
             
             # Write storage to JSON file
-            with open(self.persistence_path, 'w') as f:
-                json.dump(self.storage, f, indent=2)
+            payload = _orjson_snapshot(self.storage)
+            if payload is not None:
+                with open(self.persistence_path, 'wb') as f:
+                    f.write(payload)
+            else:
+                with open(self.persistence_path, 'w') as f:
+                    json.dump(self.storage, f, indent=2)
             return True
         except Exception as e:
             # In production, you'd log this error
@@ -183,6 +251,8 @@ class MemoryModule:
             return True  # File doesn't exist yet, start with empty storage
             
         try:
+            # json, not orjson: snapshots may hold NaN, Infinity or integers
+            # wider than 64 bits, which orjson rejects or rounds to floats
             with open(self.persistence_path, 'r') as f:
                 self.storage = json.load(f)
             return True
@@ -22,6 +22,7 @@ Thin interface layer:
 """
 
 import argparse
+import functools
 import sys
 from typing import Optional, Any
 
@@ -56,8 +57,15 @@ class CLI:
         """
         self.cis = cis
         
-    def _create_parser(self) -> argparse.ArgumentParser:
-        """Create argument parser"""
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _create_parser() -> argparse.ArgumentParser:
+        """
+        Create argument parser
+        
+        Parsing leaves the parser unchanged, so one parser is built and
+        shared by every CLI instance.
+        """
         parser = argparse.ArgumentParser(
             prog='thalos',
             description='Thalos Prime v1.0 - Command Line Interface'
@@ -271,16 +271,12 @@ class ActionHandler:
     def _execute_memory_list(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """List all memory entries"""
         memory = self.cis.get_memory()
-        keys = memory.list_keys()
-        
-        entries = {}
-        for key in keys:
-            entries[key] = memory.read(key)
+        entries = memory.read_all()
         
         return {
             'success': True,
-            'message': f"Found {len(keys)} memory entries",
-            'count': len(keys),
+            'message': f"Found {len(entries)} memory entries",
+            'count': len(entries),
             'entries': entries
         }
     
@@ -0,0 +1,90 @@
+"""
+© 2026 Tony Ray Macier III. All rights reserved.
+
+Thalos Prime™ is a proprietary system.
+"""
+
+"""
+JSON Provider - orjson-backed JSON encoding for the Flask app
+
+Chat and status payloads are nested dicts of floats and strings, which
+orjson encodes several times faster than the stdlib encoder. orjson is
+optional; without it the web server keeps Flask's default provider.
+"""
+
+from typing import Any
+import json
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider that serializes with orjson
+
+    Keeps DefaultJSONProvider's behaviour for sorted keys, the fallback
+    ``default`` hook and debug-mode indentation. NumPy scalars and arrays
+    are serialized natively. Calls with encoder options orjson has no
+    equivalent for are passed to the stdlib implementation.
+    """
+
+    option = (orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS) if ORJSON_AVAILABLE else 0
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """
+        Serialize data as a JSON string
+
+        Args:
+            obj: Data to serialize
+            **kwargs: json.dumps-style options
+
+        Returns:
+            JSON text
+        """
+        indent = kwargs.get('indent')
+        separators = kwargs.get('separators')
+        if (set(kwargs) - {'indent', 'separators'} or indent not in (None, 2)
+                or separators not in (None, (',', ':'))):
+            return super().dumps(obj, **kwargs)
+
+        option = self.option
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode('utf-8')
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        """
+        Deserialize JSON text or UTF-8 bytes
+
+        Args:
+            s: JSON document
+
+        Returns:
+            Decoded Python object
+        """
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+
+def dumps_indented(obj: Any) -> str:
+    """
+    Serialize data as JSON indented by two spaces
+
+    Args:
+        obj: Data to serialize
+
+    Returns:
+        Indented JSON text
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=ORJSONProvider.option | orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(obj, indent=2)
@@ -11,6 +11,7 @@ Provides intelligent query understanding and response generation
 """
 
 from typing import Dict, List, Any, Tuple
+import functools
 import re
 
 
@@ -70,6 +71,9 @@ class NLPProcessor:
         
         # Knowledge base
         self.knowledge_base = self._build_knowledge_base()
+        
+        # Analysis is deterministic in the message, so repeat queries are memoized
+        self._analyze_cached = functools.lru_cache(maxsize=4096)(self._analyze)
     
     def _build_knowledge_base(self) -> Dict[str, str]:
         """Build knowledge base for common queries"""
@@ -123,6 +127,17 @@ All decisions are evaluated against these principles."""
         Returns:
             Analysis dict with intent, topics, sentiment, etc.
         """
+        analysis = self._analyze_cached(message)
+        
+        # Hand out a copy so callers cannot mutate the memoized result
+        return {
+            **analysis,
+            'topics': list(analysis['topics']),
+            'entities': list(analysis['entities'])
+        }
+    
+    def _analyze(self, message: str) -> Dict[str, Any]:
+        """Run the full message analysis (uncached)"""
         message_lower = message.lower()
         
         # Detect intent
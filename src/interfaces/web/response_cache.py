@@ -0,0 +1,198 @@
+"""
+© 2026 Tony Ray Macier III. All rights reserved.
+
+Thalos Prime™ is a proprietary system.
+"""
+
+"""
+Response Cache - Two-tier cache for chatbot responses
+
+Lets the chat endpoint skip the wetware + neural pipeline for repeat traffic:
+- Exact tier: LRU dict keyed by a BLAKE2b digest of the message
+- Semantic tier (opt-in): cosine similarity over hashed character n-gram
+  embeddings
+"""
+
+from typing import Dict, Any, Optional, Hashable
+from collections import OrderedDict
+import hashlib
+import threading
+import zlib
+
+import numpy as np
+
+
+class ResponseCache:
+    """
+    LRU response cache with an optional near-duplicate lookup
+
+    Entries are stored under an exact message digest. When the semantic tier
+    is enabled, every entry also owns a row in a preallocated embedding matrix
+    so a near-duplicate query costs one matrix-vector product.
+    
+    A semantic hit returns the payload stored for a different message, so
+    the tier is off by default and only suits payloads that neither quote
+    the message nor carry per-message metadata.
+    """
+
+    def __init__(self, maxsize: int = 1024, similarity_threshold: float = 0.9,
+                 embedding_dim: int = 128, ngram: int = 3, semantic: bool = False):
+        """
+        Initialize the response cache
+
+        Args:
+            maxsize: Maximum number of cached responses; 0 disables caching
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+            embedding_dim: Width of the hashed n-gram embedding
+            ngram: Character n-gram length used for embeddings
+            semantic: Enable the embedding-similarity tier (off by default)
+        """
+        self.maxsize = maxsize
+        self.similarity_threshold = similarity_threshold
+        self.embedding_dim = embedding_dim
+        self.ngram = ngram
+        self.semantic = semantic
+
+        # Exact tier: digest -> (payload, slot)
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+
+        # Semantic tier: one embedding row per slot
+        self._embeddings = np.zeros((maxsize, embedding_dim), dtype=np.float32)
+        self._slot_keys: list = [None] * maxsize
+        self._free_slots = list(range(maxsize - 1, -1, -1))
+
+        # Cached responses are only valid for the state they were computed in
+        self._state_token: Optional[Hashable] = None
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.exact_hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(message: str) -> str:
+        """Digest a message into its exact-tier key"""
+        return hashlib.blake2b(message.encode('utf-8'), digest_size=16).hexdigest()
+
+    def embed(self, message: str) -> np.ndarray:
+        """
+        Embed a message as a unit-norm hashed character n-gram vector
+
+        Args:
+            message: Input text
+
+        Returns:
+            float32 vector of length embedding_dim
+        """
+        text = f" {message.lower().strip()} "
+        vector = np.zeros(self.embedding_dim, dtype=np.float32)
+        n = self.ngram
+        if len(text) < n:
+            return vector
+
+        buckets = [zlib.crc32(text[i:i + n].encode('utf-8')) % self.embedding_dim
+                   for i in range(len(text) - n + 1)]
+        np.add.at(vector, buckets, 1.0)
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector /= norm
+        return vector
+
+    def sync_state(self, state_token: Hashable) -> None:
+        """
+        Invalidate all entries if the system state they depend on changed
+
+        Args:
+            state_token: Hashable snapshot of the state responses depend on
+        """
+        with self._lock:
+            if state_token != self._state_token:
+                self._clear_locked()
+                self._state_token = state_token
+
+    def get(self, message: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response
+
+        Args:
+            message: Incoming chat message
+
+        Returns:
+            Cached payload if found, None otherwise
+        """
+        key = self.make_key(message)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.exact_hits += 1
+                return entry[0]
+
+            if self.semantic and self._entries:
+                scores = self._embeddings @ self.embed(message)
+                slot = int(np.argmax(scores))
+                slot_key = self._slot_keys[slot]
+                if slot_key is not None and scores[slot] >= self.similarity_threshold:
+                    self._entries.move_to_end(slot_key)
+                    self.semantic_hits += 1
+                    return self._entries[slot_key][0]
+
+            self.misses += 1
+            return None
+
+    def put(self, message: str, payload: Dict[str, Any]) -> None:
+        """
+        Store a response payload
+
+        Args:
+            message: Chat message the payload answers
+            payload: Response payload to cache
+        """
+        if self.maxsize <= 0:
+            return
+
+        key = self.make_key(message)
+        embedding = self.embed(message) if self.semantic else None
+        with self._lock:
+            if key in self._entries:
+                slot = self._entries[key][1]
+                self._entries.move_to_end(key)
+            else:
+                if not self._free_slots:
+                    _, (_, evicted_slot) = self._entries.popitem(last=False)
+                    self._release_slot(evicted_slot)
+                slot = self._free_slots.pop()
+                self._slot_keys[slot] = key
+
+            self._entries[key] = (payload, slot)
+            if embedding is not None:
+                self._embeddings[slot] = embedding
+
+    def clear(self) -> None:
+        """Remove all cached responses"""
+        with self._lock:
+            self._clear_locked()
+
+    def _clear_locked(self) -> None:
+        self._entries.clear()
+        self._embeddings.fill(0.0)
+        self._slot_keys = [None] * self.maxsize
+        self._free_slots = list(range(self.maxsize - 1, -1, -1))
+
+    def _release_slot(self, slot: int) -> None:
+        self._embeddings[slot] = 0.0
+        self._slot_keys[slot] = None
+        self._free_slots.append(slot)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        lookups = self.exact_hits + self.semantic_hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "exact_hits": self.exact_hits,
+            "semantic_hits": self.semantic_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.exact_hits + self.semantic_hits) / lookups, 4) if lookups else 0.0
+        }
@@ -174,9 +174,13 @@ class ThalosChat {
         // Header with metadata
         const header = document.createElement('div');
         header.className = 'ai-message-header';
+        // Cached replies carry no wetware figures, so confidence may be absent
+        const confidence = metadata.confidence !== undefined
+            ? `Confidence: ${(metadata.confidence * 100).toFixed(1)}% | `
+            : '';
         header.innerHTML = `
             <span>🧠 THALOS RESPONSE</span>
-            <span>Confidence: ${(metadata.confidence * 100).toFixed(1)}% | Time: ${metadata.processingTime}s</span>
+            <span>${confidence}Time: ${metadata.processingTime}s</span>
         `;
         
         // Icon
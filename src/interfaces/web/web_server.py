@@ -12,15 +12,25 @@ Fully integrates with wetware, AI, and database systems
 """
 
 from flask import Flask, render_template, request, jsonify, send_from_directory
+import atexit
+import functools
+import logging
+import logging.handlers
 import os
+import queue
+import re
 import sys
+import threading
+import time
 from typing import Dict, Any, List
 
+import numpy as np
+
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from core.cis import CIS
-from wetware.organoid_core import OrganoidCore
+from wetware.organoid_core import OrganoidCore, NO_SPIKES, OUTPUT_CHANNELS
 from wetware.mea_interface import MEAInterface
 from wetware.life_support import LifeSupport
 from ai.neural.bio_neural_network import BioNeuralNetwork
@@ -28,11 +38,29 @@ from ai.learning.reinforcement_learner import ReinforcementLearner
 from database.connection_manager import DatabaseManager
 from interfaces.web.nlp_processor import NLPProcessor
 from interfaces.web.action_handler import ActionHandler
+from interfaces.web.response_cache import ResponseCache
+from interfaces.web.json_provider import ORJSONProvider, ORJSON_AVAILABLE, dumps_indented
+
+# Request-path log records are queued and written by a listener thread, so
+# request threads never block on stream I/O. The listener is started with
+# the other background threads (see _start_background_threads)
+logger = logging.getLogger(__name__)
+_log_queue: queue.Queue = queue.Queue(-1)
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_handler)
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+logger.setLevel(logging.INFO)
+logger.propagate = False
 
 app = Flask(__name__,
             template_folder='templates',
             static_folder='static')
 
+# Serialize API responses with orjson when it is installed
+if ORJSON_AVAILABLE:
+    app.json = ORJSONProvider(app)
+
 # Initialize Thalos Prime system
 print("Initializing Thalos Prime Synthetic Biological Intelligence...")
 cis = CIS()
@@ -55,6 +83,25 @@ life_support.initialize()
 mea = MEAInterface(channels=20000)
 mea.initialize()
 
+# Organoid spikes carry an OUTPUT_CHANNELS index; each output channel is read
+# on the first electrode of the MEA region whose response it reports
+_OUTPUT_REGIONS = {
+    "general_output": "output_motor",
+    "pattern_output": "pattern_recognition",
+    "logic_output": "executive_function",
+    "creative_output": "creative_synthesis",
+    "governance_output": "ethical_evaluation"
+}
+_OUTPUT_ELECTRODES = np.array([
+    np.flatnonzero(mea.region_ids == mea.region_names.index(_OUTPUT_REGIONS[channel]))[0]
+    for channel in OUTPUT_CHANNELS
+])
+_ELECTRODE_SPIKE_DTYPE = np.dtype([
+    ("timestamp", np.float32),
+    ("amplitude", np.float32),
+    ("channel", np.int32)  # MEA electrode ID
+])
+
 # Create organoid lobes
 organoids = []
 lobe_types = ['logic', 'abstract', 'governance']
@@ -81,11 +128,61 @@ neural_net.connect_layers(hidden_layer2, output_layer, 0.7)
 print("✓ Bio Neural Network ready")
 print("✓ Reinforcement Learner ready")
 
+# Initialize Action Handler
+action_handler = ActionHandler(cis, organoids, mea, life_support, neural_net, rl_agent, db_manager)
+print("✓ Action Handler initialized")
+
+# Response cache lets repeat queries skip the wetware + neural pipeline.
+# Exact matches only: responses quote the message and carry its NLP analysis.
+response_cache = ResponseCache(maxsize=1024)
+
+# Chat metadata that depends only on the message, and so stays valid on a cache hit
+_CACHED_METADATA = ('nlpAnalysis', 'actionExecuted', 'actionSuccess')
+
+# Chat interactions are stored by a background writer, off the request path
+INTERACTION_BATCH_SIZE = 64
+interaction_queue: queue.Queue = queue.Queue(maxsize=10000)
+
+# The wetware and neural simulations are stateful and shared by all request
+# threads; only one request may step them at a time
+simulation_lock = threading.Lock()
+
+# Life support models slow homeostasis. Requests only count the simulated
+# seconds they consume; a background ticker applies them and republishes the
+# status snapshots that requests read
+LIFE_SUPPORT_INTERVAL = 0.1  # seconds between ticks
+life_support_pending_ticks = 0
+life_support_snapshot: Dict[str, Any] = {}
+mea_snapshot: Dict[str, Any] = {}
+
 print("\n" + "="*70)
 print("THALOS PRIME WETWARE SYSTEM ONLINE")
 print("="*70)
 
 
+@functools.lru_cache(maxsize=256)
+def _query_pulse_pattern(length: int) -> Dict[str, Any]:
+    """
+    Build the MEA pulse pattern for a chat query
+    
+    A query's pulse pattern depends only on its intensity, which is derived
+    from the message length, so one pattern is built per length and reused.
+    The returned pattern is shared and must not be mutated.
+    
+    Args:
+        length: Message length in characters
+        
+    Returns:
+        Pulse pattern for MEA transmission
+    """
+    digital_signal = {
+        'type': 'query',
+        'data': {},
+        'intensity': min(1.0, length / 50.0)  # Based on message length
+    }
+    return mea.build_pulse_pattern(digital_signal)
+
+
 def process_through_wetware(message: str) -> Dict[str, Any]:
     """
     Process message through complete wetware pipeline:
@@ -93,7 +190,7 @@ def process_through_wetware(message: str) -> Dict[str, Any]:
     2. Encode to electrical pulses via MEA
     3. Process through organoid lobes
     4. Decode spike trains back to digital
-    5. Update life support
+    5. Queue a life support update (applied by the background ticker)
     
     Args:
         message: Input text message
@@ -101,53 +198,161 @@ def process_through_wetware(message: str) -> Dict[str, Any]:
     Returns:
         Dict containing response and biological metadata
     """
-    # Step 1: Convert message to digital signal
-    digital_signal = {
-        'type': 'query',
-        'data': {'text': message},
-        'intensity': min(1.0, len(message) / 50.0)  # Based on message length
-    }
-    
-    # Step 2: Encode via MEA (digital to biological)
-    pulse_pattern = mea.encode_digital_to_pulse(digital_signal)
+    # Steps 1-2: Convert message to a digital signal and encode it via MEA
+    # (digital to biological); the pattern is built once per message length
+    pulse_pattern = mea.transmit_pulse_pattern(_query_pulse_pattern(len(message)))
     
     # Step 3: Process through each organoid lobe
-    lobe_responses = []
-    for organoid in organoids:
-        # Convert pulse pattern to stimulus for organoid
-        stimulus = {
-            'type': 'pattern',
-            'intensity': pulse_pattern.get('frequency', 50) / 100.0,
-            'data': pulse_pattern
-        }
-        
-        # Process through organoid
-        response = organoid.process_stimulus(stimulus)
-        lobe_responses.append(response)
-        
-        # Apply feedback based on response quality
-        confidence = response.get('confidence', 0.5)
-        organoid.apply_feedback(reward=(confidence > 0.5), intensity=abs(confidence - 0.5) * 2)
-    
-    # Step 4: Collect spike trains and decode via MEA
-    all_spikes = []
-    for response in lobe_responses:
-        all_spikes.extend(response.get('spikes', []))
+    lobe_responses = [_run_lobe(organoid, pulse_pattern) for organoid in organoids]
+    
+    # Step 4: Collect spike trains and decode via MEA; silent lobes are
+    # skipped so a single firing lobe's train is decoded without a copy
+    spike_arrays = [response['spikes'] for response in lobe_responses
+                    if len(response.get('spikes', ()))]
+    if len(spike_arrays) > 1:
+        all_spikes = np.concatenate(spike_arrays)
+    else:
+        all_spikes = spike_arrays[0] if spike_arrays else NO_SPIKES
     
-    # Decode biological response to digital
-    decoded_response = mea.decode_spike_train(all_spikes)
+    # Decode biological response to digital, on the electrodes that record
+    # each output channel
+    electrode_spikes = np.empty(all_spikes.shape[0], dtype=_ELECTRODE_SPIKE_DTYPE)
+    electrode_spikes["timestamp"] = all_spikes["timestamp"]
+    electrode_spikes["amplitude"] = all_spikes["amplitude"]
+    electrode_spikes["channel"] = _OUTPUT_ELECTRODES[all_spikes["channel"]]
+    decoded_response = mea.decode_spike_train(electrode_spikes)
     
-    # Step 5: Update life support
-    life_support.update(dt=1.0)
+    # Step 5: Queue one second of life support time for the background ticker
+    global life_support_pending_ticks
+    life_support_pending_ticks += 1
     
     # Compile comprehensive response
     return {
         'lobe_responses': lobe_responses,
         'decoded': decoded_response,
-        'life_support': life_support.get_status(),
-        'mea_stats': mea.get_status(),
-        'total_spikes': len(all_spikes)
+        'life_support': life_support_snapshot,
+        'mea_stats': mea_snapshot,
+        'total_spikes': all_spikes.shape[0]
+    }
+
+
+def _store_interactions() -> None:
+    """
+    Drain the interaction queue into the database
+    
+    Runs on a daemon thread. Records are written in batches so each batch
+    costs a single pool checkout, keeping the pool off the request path.
+    """
+    while True:
+        batch = [interaction_queue.get()]
+        while len(batch) < INTERACTION_BATCH_SIZE:
+            try:
+                batch.append(interaction_queue.get_nowait())
+            except queue.Empty:
+                break
+        
+        try:
+            conn = db_manager.pool.get_connection()
+            try:
+                data = conn['data']
+                for record in batch:
+                    data[f'chat_{len(data)}'] = record
+            finally:
+                db_manager.pool.return_connection(conn)
+        except Exception as e:
+            logger.error("Database storage error: %s", e)
+        finally:
+            for _ in batch:
+                interaction_queue.task_done()
+
+
+
+def _publish_snapshots() -> None:
+    """Replace the life support and MEA status snapshots read by requests"""
+    global life_support_snapshot, mea_snapshot
+    status = dict(life_support.get_status())
+    status['viability'] = life_support.get_viability_score()
+    life_support_snapshot = status
+    mea_snapshot = mea.get_status()
+
+
+def _tick_life_support() -> None:
+    """
+    Apply queued life support time and refresh the status snapshots
+    
+    Runs on a daemon thread every LIFE_SUPPORT_INTERVAL seconds. Each chat
+    request still advances the simulation by one second (dt=1.0), so the
+    physiology evolves exactly as before, just not on the request thread.
+    Snapshots are swapped in whole, never mutated, so readers need no lock.
+    """
+    global life_support_pending_ticks
+    while True:
+        time.sleep(LIFE_SUPPORT_INTERVAL)
+        with simulation_lock:
+            ticks, life_support_pending_ticks = life_support_pending_ticks, 0
+            for _ in range(ticks):
+                life_support.update(dt=1.0)
+            _publish_snapshots()
+
+
+_publish_snapshots()
+
+# Process that owns the running background threads
+_background_pid = None
+_background_lock = threading.Lock()
+
+
+@app.before_request
+def _start_background_threads() -> None:
+    """
+    Start the log listener, interaction writer and life support ticker
+    
+    Threads do not survive fork, so they are started by the first request
+    each process serves rather than at import. Under gunicorn --preload the
+    master imports the app and boots the system once, but never starts
+    them, so workers fork without a background thread holding any lock.
+    """
+    global _background_pid
+    if _background_pid == os.getpid():
+        return
+    with _background_lock:
+        if _background_pid == os.getpid():
+            return
+        _log_listener.start()
+        atexit.register(_log_listener.stop)
+        threading.Thread(target=_store_interactions, name='interaction-writer', daemon=True).start()
+        threading.Thread(target=_tick_life_support, name='life-support-ticker', daemon=True).start()
+        _background_pid = os.getpid()
+
+
+def _run_lobe(organoid: OrganoidCore, pulse_pattern: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Process a pulse pattern through one organoid lobe and apply its feedback
+    
+    Lobes share no mutable state, so each call only touches its own organoid.
+    
+    Args:
+        organoid: Organoid lobe to stimulate
+        pulse_pattern: Encoded MEA pulse pattern
+        
+    Returns:
+        Spike train response from the lobe
+    """
+    # Convert pulse pattern to stimulus for organoid
+    stimulus = {
+        'type': 'pattern',
+        'intensity': pulse_pattern.get('frequency', 50) / 100.0,
+        'data': pulse_pattern
     }
+    
+    # Process through organoid
+    response = organoid.process_stimulus(stimulus)
+    
+    # Apply feedback based on response quality
+    confidence = response.get('confidence', 0.5)
+    organoid.apply_feedback(reward=(confidence > 0.5), intensity=abs(confidence - 0.5) * 2)
+    
+    return response
 
 
 @app.route('/')
@@ -172,27 +377,37 @@ def chat():
         if not message:
             return jsonify({'error': 'No message provided'}), 400
         
-        # Step 1: Analyze message with NLP
-        analysis = nlp.analyze_message(message)
-        
-        # Step 2: Detect if user wants to execute an action
+        # Step 1: Detect if user wants to execute an action
         action_type, action_params = action_handler.detect_action(message)
         
-        # Step 3: Process through complete wetware pipeline
-        wetware_result = process_through_wetware(message)
-        
-        # Step 4: Also process through neural network
-        input_pattern = message_to_pattern(message)
-        neural_net.stimulate_inputs(input_pattern)
+        # Plain conversation is answered from cache while wetware state is unchanged;
+        # actions always execute because they have side effects
+        if not action_type:
+            response_cache.sync_state(life_support.status)
+            cached = response_cache.get(message)
+            if cached is not None:
+                _queue_interaction({**cached['interaction'], 'cached': True})
+                return jsonify({
+                    'response': cached['response'],
+                    'metadata': {**cached['metadata'], 'processingTime': 0.0, 'cached': True},
+                    'action_result': None
+                })
         
-        for _ in range(50):
-            neural_net.simulate_step()
+        # Step 2: Analyze message with NLP
+        analysis = nlp.analyze_message(message)
         
-        output_activity = neural_net.get_output_activity()
-        net_stats = neural_net.get_network_stats()
+        input_pattern = message_to_pattern(message)
         
-        # Add wetware viability
-        wetware_result['life_support']['viability'] = life_support.get_viability_score()
+        with simulation_lock:
+            # Step 3: Process through complete wetware pipeline
+            wetware_result = process_through_wetware(message)
+            
+            # Step 4: Also process through neural network
+            neural_net.stimulate_inputs(input_pattern)
+            neural_net.simulate_until_stable(max_steps=50)
+            
+            output_activity = neural_net.get_output_activity()
+            net_stats = neural_net.get_network_stats()
         
         # Step 5: Execute action if detected
         action_result = None
@@ -219,36 +434,42 @@ def chat():
                     message, wetware_result, output_activity, net_stats
                 )
         
-        # Step 7: Store interaction in database
-        try:
-            conn = db_manager.pool.get_connection()
-            interaction_id = f'chat_{len(conn["data"])}'
-            conn['data'][interaction_id] = {
-                'message': message,
-                'response': response_text,
-                'analysis': analysis,
-                'action_executed': action_type,
-                'action_result': action_result,
-                'wetware_data': {
-                    'total_spikes': wetware_result['total_spikes'],
-                    'lobes_active': len(wetware_result['lobe_responses']),
-                    'decoded_confidence': wetware_result['decoded'].get('confidence', 0),
-                    'intent': analysis['intent'],
-                    'topics': analysis['topics']
-                }
+        # Step 7: Queue interaction for storage in database
+        interaction = {
+            'message': message,
+            'response': response_text,
+            'analysis': analysis,
+            'action_executed': action_type,
+            'action_result': action_result,
+            'wetware_data': {
+                'total_spikes': wetware_result['total_spikes'],
+                'lobes_active': len(wetware_result['lobe_responses']),
+                'decoded_confidence': wetware_result['decoded'].get('confidence', 0),
+                'intent': analysis['intent'],
+                'topics': analysis['topics']
             }
-            db_manager.pool.return_connection(conn)
-        except Exception as e:
-            print(f"Database storage error: {e}")
+        }
+        _queue_interaction(interaction)
         
         # Step 8: Prepare comprehensive metadata
         life_support_status = wetware_result['life_support']
         lobe_responses = wetware_result['lobe_responses']
         
+        # One pass over the lobes for density, health and the active list
+        total_confidence = 0.0
+        min_confidence = float('inf')
+        active_lobes = []
+        for r in lobe_responses:
+            c = r.get('confidence', 0)
+            total_confidence += c
+            if c < min_confidence:
+                min_confidence = c
+            active_lobes.append(r['lobe_type'])
+        
         metadata = {
-            'neuralDensity': sum(r.get('confidence', 0) for r in lobe_responses) / len(lobe_responses) if lobe_responses else 0,
+            'neuralDensity': total_confidence / len(lobe_responses) if lobe_responses else 0,
             'confidence': wetware_result['decoded'].get('confidence', 0.5),
-            'activeLobes': [r['lobe_type'] for r in lobe_responses],
+            'activeLobes': active_lobes,
             'processingTime': round(net_stats.get('current_time', 0) / 1000.0, 2),
             'spikeCount': wetware_result['total_spikes'],
             'synapticWeight': net_stats.get('avg_synaptic_weight', 0.5),
@@ -256,10 +477,10 @@ def chat():
                 'temperature': life_support_status['temperature'],
                 'ph': life_support_status['ph_level'],
                 'oxygen': life_support_status['oxygen_saturation'],
-                'viability': life_support.get_viability_score()
+                'viability': life_support_status['viability']
             },
             'meaChannels': wetware_result['mea_stats']['active_channels'],
-            'organoidHealth': 'optimal' if all(r.get('confidence', 0) > 0.3 for r in lobe_responses) else 'suboptimal',
+            'organoidHealth': 'optimal' if min_confidence > 0.3 else 'suboptimal',
             'nlpAnalysis': {
                 'intent': analysis['intent'],
                 'topics': analysis['topics'],
@@ -270,6 +491,16 @@ def chat():
             'actionSuccess': action_result.get('success') if action_result else False
         }
         
+        # Only message-derived metadata is cached; spike, synapse, MEA and
+        # life support figures describe this run and go stale as the
+        # organoids keep learning
+        if not action_type:
+            response_cache.put(message, {
+                'response': response_text,
+                'metadata': {key: metadata[key] for key in _CACHED_METADATA},
+                'interaction': interaction
+            })
+        
         return jsonify({
             'response': response_text,
             'metadata': metadata,
@@ -277,12 +508,18 @@ def chat():
         })
         
     except Exception as e:
-        print(f"Chat error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Chat error: %s", e)
         return jsonify({'error': str(e)}), 500
 
 
+def _queue_interaction(record: Dict[str, Any]) -> None:
+    """Hand an interaction record to the database writer without blocking"""
+    try:
+        interaction_queue.put_nowait(record)
+    except queue.Full:
+        logger.warning("Database storage error: interaction queue full, record dropped")
+
+
 def _format_action_response(action_result: Dict[str, Any], action_type: str) -> str:
     """Format action result into readable response"""
     if not action_result.get('success'):
@@ -314,7 +551,7 @@ def _format_action_response(action_result: Dict[str, Any], action_type: str) ->
         # Format status nicely
         status = action_result.get('status') or action_result.get('organoids')
         if status:
-            message += "\n\n" + json.dumps(status, indent=2)
+            message += "\n\n" + dumps_indented(status)
     
     elif 'explain' in action_type:
         explanation = action_result.get('explanation')
@@ -328,13 +565,16 @@ def _format_action_response(action_result: Dict[str, Any], action_type: str) ->
 def get_status():
     """Get comprehensive system status including wetware"""
     cis_status = cis.status()
-    neural_stats = neural_net.get_network_stats()
     rl_stats = rl_agent.get_statistics()
     
-    # Get wetware status
-    organoid_statuses = [org.get_status() for org in organoids]
-    mea_status = mea.get_status()
-    life_support_status = life_support.get_status()
+    # Snapshot network and wetware state under the simulation lock so the
+    # ticker and chat requests cannot mutate it mid-read
+    with simulation_lock:
+        neural_stats = neural_net.get_network_stats()
+        organoid_statuses = [org.get_status() for org in organoids]
+        mea_status = mea.get_status()
+        life_support_status = life_support.get_status()
+        viability_score = life_support.get_viability_score()
     db_stats = db_manager.get_statistics()
     
     return jsonify({
@@ -345,25 +585,46 @@ def get_status():
             'organoids': organoid_statuses,
             'mea': mea_status,
             'life_support': life_support_status,
-            'viability_score': life_support.get_viability_score()
+            'viability_score': viability_score
         },
         'database': db_stats,
+        'response_cache': response_cache.get_statistics(),
         'system_health': 'OPERATIONAL'
     })
 
 
+def _agg(statuses: List[Dict[str, Any]], *keys: str) -> List[float]:
+    """
+    Average numeric fields across status dicts
+    
+    The fields are gathered into one (len(statuses), len(keys)) array and
+    reduced column-wise, so adding fields or lobes adds no Python passes.
+    
+    Args:
+        statuses: Status dictionaries
+        *keys: Fields to average
+        
+    Returns:
+        Mean of each key, in order
+    """
+    if not statuses:
+        return [0.0] * len(keys)
+    values = np.fromiter((status[key] for status in statuses for key in keys),
+                         dtype=np.float64, count=len(statuses) * len(keys))
+    return values.reshape(len(statuses), len(keys)).mean(axis=0).tolist()
+
+
 @app.route('/api/metrics', methods=['GET'])
 def get_metrics():
     """Get detailed system metrics including wetware"""
-    neural_stats = neural_net.get_network_stats()
-    organoid_statuses = [org.get_status() for org in organoids]
-    life_support_status = life_support.get_status()
+    with simulation_lock:
+        neural_stats = neural_net.get_network_stats()
+        organoid_statuses = [org.get_status() for org in organoids]
+        life_support_status = life_support.get_status()
+        viability_score = life_support.get_viability_score()
     
-    # Calculate aggregate neural density from organoids
-    avg_neural_density = sum(org['neural_density'] for org in organoid_statuses) / len(organoid_statuses)
-    
-    # Calculate aggregate accuracy from organoids
-    avg_accuracy = sum(org['accuracy_score'] for org in organoid_statuses) / len(organoid_statuses)
+    # Aggregate neural density and accuracy from organoids
+    avg_neural_density, avg_accuracy = _agg(organoid_statuses, 'neural_density', 'accuracy_score')
     
     return jsonify({
         'neural_density': avg_neural_density,
@@ -372,64 +633,132 @@ def get_metrics():
         'synaptic_connections': neural_stats.get('num_synapses', 0),
         'active_neurons': neural_stats.get('num_neurons', 0),
         'organoid_count': len(organoids),
-        'life_support_viability': life_support.get_viability_score(),
+        'life_support_viability': viability_score,
         'temperature': life_support_status['temperature'],
         'oxygen_saturation': life_support_status['oxygen_saturation']
     })
 
 
-def message_to_pattern(message: str) -> list:
+# ASCII bytes in each character class (alpha, digit, space, upper). A class
+# count is the number of bytes bytes.translate() deletes from the encoded
+# message: one C loop per class with no per-call array setup. Bytes >= 128
+# belong to multi-byte UTF-8 sequences and are never counted.
+_ALPHA_BYTES, _DIGIT_BYTES, _SPACE_BYTES, _UPPER_BYTES = (
+    bytes(code for code in range(128) if is_class(chr(code)))
+    for is_class in (str.isalpha, str.isdigit, str.isspace, str.isupper)
+)
+
+# Sentiment indicators (simplified): both word lists folded into one
+# alternation so a single scan finds either polarity; group 1 is positive
+_SENTIMENT_WORDS_RE = re.compile(r'\b(?:(good|great|yes|thanks|hello)|bad|no|error|wrong)\b')
+
+
+def _sentiment_flags(message_lower: str) -> tuple:
     """
-    Convert text message to neural input pattern
+    Detect positive and negative sentiment words in one scan
     
     Args:
-        message: Input text
+        message_lower: Lower-cased message
         
     Returns:
-        List of input values (0.0 to 1.0)
+        Tuple of (positive, negative) indicators as 0.0/1.0
     """
-    # Simple encoding: character frequencies and message properties
-    pattern = []
-    
-    # Message length (normalized)
-    pattern.append(min(1.0, len(message) / 100.0))
+    positive = negative = False
+    for match in _SENTIMENT_WORDS_RE.finditer(message_lower):
+        if match.lastindex:
+            positive = True
+        else:
+            negative = True
+        if positive and negative:
+            break
+    return (1.0 if positive else 0.0, 1.0 if negative else 0.0)
+
+
+@functools.lru_cache(maxsize=4096)
+def message_to_pattern(message: str) -> tuple:
+    """
+    Convert text message to neural input pattern
     
-    # Character type ratios
-    alpha_count = sum(1 for c in message if c.isalpha())
-    digit_count = sum(1 for c in message if c.isdigit())
-    space_count = sum(1 for c in message if c.isspace())
+    Character classes are counted over the message's UTF-8 bytes with
+    bytes.translate (ASCII classes only). Results are cached and shared
+    between callers, so the pattern is returned as an immutable tuple.
     
+    Args:
+        message: Input text
+        
+    Returns:
+        Tuple of input values (0.0 to 1.0)
+    """
+    encoded = message.encode('utf-8', 'ignore')
+    n = len(encoded)
     total = len(message) if len(message) > 0 else 1
-    pattern.append(alpha_count / total)
-    pattern.append(digit_count / total)
-    pattern.append(space_count / total)
-    
-    # Word count (normalized)
-    word_count = len(message.split())
-    pattern.append(min(1.0, word_count / 20.0))
-    
-    # Uppercase ratio
-    upper_count = sum(1 for c in message if c.isupper())
-    pattern.append(upper_count / total)
     
-    # Question detection
-    pattern.append(1.0 if '?' in message else 0.0)
-    
-    # Command detection
-    pattern.append(1.0 if message.startswith('/') else 0.0)
-    
-    # Sentiment indicators (simplified)
-    positive_words = ['good', 'great', 'yes', 'thanks', 'hello']
-    negative_words = ['bad', 'no', 'error', 'wrong']
-    
-    message_lower = message.lower()
-    has_positive = any(word in message_lower for word in positive_words)
-    has_negative = any(word in message_lower for word in negative_words)
-    
-    pattern.append(1.0 if has_positive else 0.0)
-    pattern.append(1.0 if has_negative else 0.0)
-    
-    return pattern
+    # Character type counts
+    alpha_count = n - len(encoded.translate(None, _ALPHA_BYTES))
+    digit_count = n - len(encoded.translate(None, _DIGIT_BYTES))
+    space_count = n - len(encoded.translate(None, _SPACE_BYTES))
+    upper_count = n - len(encoded.translate(None, _UPPER_BYTES))
+    
+    has_positive, has_negative = _sentiment_flags(message.lower())
+    
+    return (
+        # Message length (normalized)
+        min(1.0, len(message) / 100.0),
+        # Character type ratios
+        alpha_count / total,
+        digit_count / total,
+        space_count / total,
+        # Word count (normalized)
+        min(1.0, len(message.split()) / 20.0),
+        # Uppercase ratio
+        upper_count / total,
+        # Question detection
+        1.0 if '?' in message else 0.0,
+        # Command detection
+        1.0 if message.startswith('/') else 0.0,
+        # Sentiment indicators
+        has_positive,
+        has_negative
+    )
+
+
+# Response templates keyed by dominant lobe, formatted once per response
+_LOBE_TEMPLATES = {
+    'logic': (
+        "Logic Lobe Analysis: Query '{message}' processed through {spikes} action potentials. "
+        "Frontal cortex analog engaged with {firing_rate:.1f}Hz firing rate. "
+        "Deterministic reasoning pathway activated. Synaptic consensus: {confidence:.2f}"
+    ),
+    'abstract': (
+        "Abstract Lobe Synthesis: Your query stimulates {spikes} neural spikes across temporal cortex analog. "
+        "Creative synthesis activated at {firing_rate:.1f}Hz. "
+        "Novel pattern correlation emerging with {confidence:.2f} coherence."
+    ),
+    'governance': (
+        "Governance Lobe Assessment: Parietal cortex analog evaluating query through {spikes} spikes. "
+        "Prime Directive alignment: {confidence:.2f}. "
+        "Ethical evaluation complete at {firing_rate:.1f}Hz. ACCURACY-EXPANSION-PRESERVATION verified."
+    )
+}
+_LOBE_FALLBACK_TEMPLATE = "Multi-lobe integration processing {spikes} biological spikes. "
+
+# Response templates indexed by most active output neuron
+_NEURON_TEMPLATES = (
+    # Neuron 0: Analytical response
+    "Biological computation analysis: Query '{message}' processed through {num_synapses} synaptic pathways. Pattern classification complete with neural consensus across cortical analogs.",
+    
+    # Neuron 1: Creative response
+    "Abstract lobe synthesis: Your query stimulates novel neural pathways. Temporal cortex analog generates creative interpretation suggesting multidimensional solution space exploration.",
+    
+    # Neuron 2: Factual response
+    "Logic lobe processing: Frontal cortex analog engaged. Query analyzed through {num_neurons} neurons with spike-train coherence. Deterministic reasoning pathway activated.",
+    
+    # Neuron 3: Ethical response
+    "Governance lobe evaluation: Parietal cortex analog assesses ethical alignment. Prime Directive conformance verified. Query demonstrates {alignment}% alignment with ACCURACY-EXPANSION-PRESERVATION principles.",
+    
+    # Neuron 4: Integrated response
+    "Multi-lobe integration complete: Query '{message}' processed through wetware core with {avg_firing_rate:.1f}Hz average firing rate. Dopaminergic reward signal positive. Knowledge expansion achieved through {total_spikes} action potentials."
+)
 
 
 def generate_wetware_response(message: str, wetware_result: Dict[str, Any],
@@ -456,23 +785,12 @@ def generate_wetware_response(message: str, wetware_result: Dict[str, Any],
     lobe_type = most_active['lobe_type']
     
     # Build response based on dominant lobe
-    if lobe_type == 'logic':
-        base_response = f"Logic Lobe Analysis: Query '{message}' processed through {total_spikes} action potentials. "
-        base_response += f"Frontal cortex analog engaged with {most_active['firing_rate']:.1f}Hz firing rate. "
-        base_response += f"Deterministic reasoning pathway activated. Synaptic consensus: {most_active['confidence']:.2f}"
-        
-    elif lobe_type == 'abstract':
-        base_response = f"Abstract Lobe Synthesis: Your query stimulates {total_spikes} neural spikes across temporal cortex analog. "
-        base_response += f"Creative synthesis activated at {most_active['firing_rate']:.1f}Hz. "
-        base_response += f"Novel pattern correlation emerging with {most_active['confidence']:.2f} coherence."
-        
-    elif lobe_type == 'governance':
-        base_response = f"Governance Lobe Assessment: Parietal cortex analog evaluating query through {total_spikes} spikes. "
-        base_response += f"Prime Directive alignment: {most_active['confidence']:.2f}. "
-        base_response += f"Ethical evaluation complete at {most_active['firing_rate']:.1f}Hz. ACCURACY-EXPANSION-PRESERVATION verified."
-        
-    else:
-        base_response = f"Multi-lobe integration processing {total_spikes} biological spikes. "
+    base_response = _LOBE_TEMPLATES.get(lobe_type, _LOBE_FALLBACK_TEMPLATE).format_map({
+        'message': message,
+        'spikes': total_spikes,
+        'firing_rate': most_active['firing_rate'],
+        'confidence': most_active['confidence']
+    })
     
     # Add life support context
     if life_support['status'] == 'optimal':
@@ -513,25 +831,16 @@ def generate_response(message: str, output_activity: list, stats: dict) -> str:
     max_activity_idx = output_activity.index(max(output_activity)) if output_activity else 0
     avg_activity = sum(output_activity) / len(output_activity) if output_activity else 0
     
-    # Response templates based on output neuron activation
-    templates = [
-        # Neuron 0: Analytical response
-        f"Biological computation analysis: Query '{message}' processed through {stats.get('num_synapses', 0)} synaptic pathways. Pattern classification complete with neural consensus across cortical analogs.",
-        
-        # Neuron 1: Creative response
-        f"Abstract lobe synthesis: Your query stimulates novel neural pathways. Temporal cortex analog generates creative interpretation suggesting multidimensional solution space exploration.",
-        
-        # Neuron 2: Factual response
-        f"Logic lobe processing: Frontal cortex analog engaged. Query analyzed through {stats.get('num_neurons', 0)} neurons with spike-train coherence. Deterministic reasoning pathway activated.",
-        
-        # Neuron 3: Ethical response
-        f"Governance lobe evaluation: Parietal cortex analog assesses ethical alignment. Prime Directive conformance verified. Query demonstrates {int(avg_activity * 100)}% alignment with ACCURACY-EXPANSION-PRESERVATION principles.",
-        
-        # Neuron 4: Integrated response
-        f"Multi-lobe integration complete: Query '{message}' processed through wetware core with {stats.get('avg_firing_rate', 0):.1f}Hz average firing rate. Dopaminergic reward signal positive. Knowledge expansion achieved through {stats.get('total_spikes', 0)} action potentials."
-    ]
-    
-    response = templates[max_activity_idx % len(templates)]
+    # Only the template for the most active output neuron is formatted
+    template = _NEURON_TEMPLATES[max_activity_idx % len(_NEURON_TEMPLATES)]
+    response = template.format_map({
+        'message': message,
+        'num_synapses': stats.get('num_synapses', 0),
+        'num_neurons': stats.get('num_neurons', 0),
+        'alignment': int(avg_activity * 100),
+        'avg_firing_rate': stats.get('avg_firing_rate', 0),
+        'total_spikes': stats.get('total_spikes', 0)
+    })
     
     # Add neural activity context
     if avg_activity > 5.0:
@@ -551,4 +860,6 @@ if __name__ == '__main__':
     print(f"Web Interface: http://localhost:8000")
     print("=" * 60)
     
+    # The development server logs every request from the request thread
+    logging.getLogger('werkzeug').setLevel(logging.WARNING)
     app.run(host='0.0.0.0', port=8000, debug=False)
@@ -31,10 +31,6 @@ import os
 # Add src directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from core.cis import CIS
-from interfaces.cli import CLI
-from interfaces.api import API
-
 
 def main():
     """
@@ -47,6 +43,11 @@ def main():
     4. Connect interfaces to CIS for delegation
     5. Run CLI in interactive mode
     """
+    # Subsystem imports are deferred until the entry point actually runs
+    from core.cis import CIS
+    from interfaces.cli import CLI
+    from interfaces.api import API
+    
     print("=== Thalos Prime v1.0 ===")
     print("Deterministic System Framework")
     print()
@@ -15,10 +15,68 @@ Maintains biological viability of wetware components:
 - Microfluidic perfusion control
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List, Tuple
+import asyncio
+import functools
+import math
+import operator
+import os
 import time
 
 
+# Health alert bits
+HYPOTHERMIA_RISK = 1 << 0
+HYPERTHERMIA_RISK = 1 << 1
+ACIDOSIS = 1 << 2
+ALKALOSIS = 1 << 3
+HYPOXIA = 1 << 4
+HYPOGLYCEMIA = 1 << 5
+HYPERGLYCEMIA = 1 << 6
+NUTRIENT_DEPLETION = 1 << 7
+WASTE_ACCUMULATION = 1 << 8
+
+# Alert names in reporting order
+_ALERT_TABLE: Tuple[Tuple[str, int], ...] = (
+    ("HYPOTHERMIA_RISK", HYPOTHERMIA_RISK),
+    ("HYPERTHERMIA_RISK", HYPERTHERMIA_RISK),
+    ("ACIDOSIS", ACIDOSIS),
+    ("ALKALOSIS", ALKALOSIS),
+    ("HYPOXIA", HYPOXIA),
+    ("HYPOGLYCEMIA", HYPOGLYCEMIA),
+    ("HYPERGLYCEMIA", HYPERGLYCEMIA),
+    ("NUTRIENT_DEPLETION", NUTRIENT_DEPLETION),
+    ("WASTE_ACCUMULATION", WASTE_ACCUMULATION)
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _alert_names(mask: int) -> Tuple[str, ...]:
+    """Decode an alert bitmask into alert names, in reporting order"""
+    return tuple(name for name, bit in _ALERT_TABLE if mask & bit)
+
+
+def _versioned(name: str) -> property:
+    """
+    Property for a field reported by get_status
+    
+    Every assignment bumps the owner's _version, so the cached status and
+    safety check are rebuilt after a change from inside or outside the class.
+    
+    Args:
+        name: Public attribute name; the value is stored as _<name>
+        
+    Returns:
+        Property reading and writing the backing attribute
+    """
+    attr = "_" + name
+    
+    def fset(self, value):
+        setattr(self, attr, value)
+        self._version += 1
+    
+    return property(operator.attrgetter(attr), fset)
+
+
 class LifeSupport:
     """
     Life Support System for Wetware Core
@@ -30,7 +88,34 @@ class LifeSupport:
     - Health monitoring
     """
     
+    # Fields behind get_status and the safety check
+    active = _versioned("active")
+    status = _versioned("status")
+    temperature = _versioned("temperature")
+    ph_level = _versioned("ph_level")
+    oxygen_level = _versioned("oxygen_level")
+    glucose_level = _versioned("glucose_level")
+    perfusion_rate = _versioned("perfusion_rate")
+    nutrient_reservoir = _versioned("nutrient_reservoir")
+    waste_reservoir = _versioned("waste_reservoir")
+    temp_min = _versioned("temp_min")
+    temp_max = _versioned("temp_max")
+    ph_min = _versioned("ph_min")
+    ph_max = _versioned("ph_max")
+    oxygen_min = _versioned("oxygen_min")
+    glucose_min = _versioned("glucose_min")
+    glucose_max = _versioned("glucose_max")
+    
     def __init__(self):
+        # State version, bumped by every assignment to a versioned field;
+        # get_status is rebuilt only when it differs from the version the
+        # cached dict was built at
+        self._version = 0
+        self._status_cache: Optional[Dict[str, Any]] = None
+        self._status_version = -1
+        self._safety_cache = False
+        self._safety_version = -1
+        
         self.active = False
         self.status = "dormant"
         
@@ -50,7 +135,7 @@ class LifeSupport:
         
         # Monitoring
         self.last_check_time = time.time()
-        self.health_alerts = []
+        self._alert_mask = 0
         
         # Operational limits
         self.temp_min = 36.5
@@ -61,6 +146,10 @@ class LifeSupport:
         self.glucose_min = 3.0
         self.glucose_max = 7.0
         
+        # Perfusion ramp-down time on shutdown (s); THALOS_FAST_SHUTDOWN=1
+        # skips it for tests and short-lived tooling
+        self.shutdown_delay = 0.0 if os.environ.get("THALOS_FAST_SHUTDOWN") == "1" else 0.1
+        
     def initialize(self) -> bool:
         """
         Initialize life support systems
@@ -84,13 +173,14 @@ class LifeSupport:
     
     def _check_environmental_safety(self) -> bool:
         """Check if environmental parameters are within safe ranges"""
-        checks = [
-            self.temp_min <= self.temperature <= self.temp_max,
-            self.ph_min <= self.ph_level <= self.ph_max,
-            self.oxygen_level >= self.oxygen_min,
-            self.glucose_min <= self.glucose_level <= self.glucose_max
-        ]
-        return all(checks)
+        version = self._version
+        if self._safety_version != version:
+            self._safety_cache = (self.temp_min <= self.temperature <= self.temp_max
+                                  and self.ph_min <= self.ph_level <= self.ph_max
+                                  and self.oxygen_level >= self.oxygen_min
+                                  and self.glucose_min <= self.glucose_level <= self.glucose_max)
+            self._safety_version = version
+        return self._safety_cache
     
     def update(self, dt: float = 1.0) -> Dict[str, Any]:
         """
@@ -119,11 +209,12 @@ class LifeSupport:
         # Oxygen consumption
         self.oxygen_level -= 0.05 * dt
         
-        # Natural pH drift
-        self.ph_level += (7.4 - self.ph_level) * 0.01 * dt  # Homeostatic correction
+        # Natural pH drift: homeostatic correction, exact exponential
+        # relaxation so large steps cannot overshoot the set point
+        self.ph_level = 7.4 + (self.ph_level - 7.4) * math.exp(-0.01 * dt)
         
         # Temperature regulation
-        self.temperature += (37.0 - self.temperature) * 0.05 * dt
+        self.temperature = 37.0 + (self.temperature - 37.0) * math.exp(-0.05 * dt)
         
         # Replenish if needed
         self._auto_replenish()
@@ -147,37 +238,40 @@ class LifeSupport:
     
     def _check_alerts(self) -> None:
         """Check for health alerts"""
-        self.health_alerts.clear()
+        mask = 0
         
         if self.temperature < self.temp_min:
-            self.health_alerts.append("HYPOTHERMIA_RISK")
+            mask |= HYPOTHERMIA_RISK
         elif self.temperature > self.temp_max:
-            self.health_alerts.append("HYPERTHERMIA_RISK")
+            mask |= HYPERTHERMIA_RISK
         
         if self.ph_level < self.ph_min:
-            self.health_alerts.append("ACIDOSIS")
+            mask |= ACIDOSIS
         elif self.ph_level > self.ph_max:
-            self.health_alerts.append("ALKALOSIS")
+            mask |= ALKALOSIS
         
         if self.oxygen_level < self.oxygen_min:
-            self.health_alerts.append("HYPOXIA")
+            mask |= HYPOXIA
         
         if self.glucose_level < self.glucose_min:
-            self.health_alerts.append("HYPOGLYCEMIA")
+            mask |= HYPOGLYCEMIA
         elif self.glucose_level > self.glucose_max:
-            self.health_alerts.append("HYPERGLYCEMIA")
+            mask |= HYPERGLYCEMIA
         
         if self.nutrient_reservoir < 10.0:
-            self.health_alerts.append("NUTRIENT_DEPLETION")
+            mask |= NUTRIENT_DEPLETION
         
         if self.waste_reservoir > 90.0:
-            self.health_alerts.append("WASTE_ACCUMULATION")
+            mask |= WASTE_ACCUMULATION
         
         # Update status
-        if self.health_alerts:
-            self.status = "warning"
-        else:
-            self.status = "optimal"
+        self._alert_mask = mask
+        self.status = "warning" if mask else "optimal"
+    
+    @property
+    def health_alerts(self) -> List[str]:
+        """Names of the active health alerts"""
+        return list(_alert_names(self._alert_mask))
     
     def deliver_nutrient_boost(self, amount: float = 20.0) -> bool:
         """
@@ -218,9 +312,14 @@ class LifeSupport:
         Get current life support status
         
         Returns:
-            Status dictionary
+            Status dictionary, shared between calls until the state changes;
+            copy it before modifying
         """
-        return {
+        version = self._version
+        if self._status_version == version:
+            return self._status_cache
+            
+        self._status_cache = {
             "active": self.active,
             "status": self.status,
             "temperature": round(self.temperature, 2),
@@ -233,6 +332,8 @@ class LifeSupport:
             "health_alerts": self.health_alerts,
             "safety_status": "SAFE" if self._check_environmental_safety() else "CRITICAL"
         }
+        self._status_version = version
+        return self._status_cache
     
     def get_viability_score(self) -> float:
         """
@@ -252,11 +353,13 @@ class LifeSupport:
         nutrient_score = self.nutrient_reservoir / 100.0
         waste_score = 1.0 - (self.waste_reservoir / 100.0)
         
-        # Weighted average
-        weights = [0.2, 0.2, 0.2, 0.15, 0.15, 0.1]
-        scores = [temp_score, ph_score, oxygen_score, glucose_score, nutrient_score, waste_score]
-        
-        viability = sum(w * s for w, s in zip(weights, scores))
+        # Weighted average, accumulated in the same order as before
+        viability = 0.2 * temp_score
+        viability += 0.2 * ph_score
+        viability += 0.2 * oxygen_score
+        viability += 0.15 * glucose_score
+        viability += 0.15 * nutrient_score
+        viability += 0.1 * waste_score
         return viability
     
     def shutdown(self) -> bool:
@@ -270,10 +373,37 @@ class LifeSupport:
             return True
         
         # Gradual shutdown to prevent shock
-        self.perfusion_rate *= 0.5
-        time.sleep(0.1)
+        self._begin_shutdown()
+        if self.shutdown_delay > 0:
+            time.sleep(self.shutdown_delay)
         
-        self.active = False
-        self.status = "dormant"
+        self._complete_shutdown()
+        return True
+    
+    async def shutdown_async(self) -> bool:
+        """
+        Gracefully shutdown life support without blocking the event loop
         
+        Returns:
+            bool: True if shutdown successful
+        """
+        if not self.active:
+            return True
+        
+        # Gradual shutdown to prevent shock
+        self._begin_shutdown()
+        if self.shutdown_delay > 0:
+            await asyncio.sleep(self.shutdown_delay)
+        
+        self._complete_shutdown()
         return True
+    
+    def _begin_shutdown(self) -> None:
+        """Ramp perfusion down ahead of deactivation"""
+        self.perfusion_rate *= 0.5
+        self.status = "shutting_down"
+    
+    def _complete_shutdown(self) -> None:
+        """Deactivate once the perfusion ramp-down has elapsed"""
+        self.active = False
+        self.status = "dormant"
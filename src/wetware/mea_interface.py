@@ -22,8 +22,91 @@ Manages communication with High-Density Multi-Electrode Arrays (HD-MEA)
 - Bidirectional data flow
 """
 
-from typing import Dict, List, Optional, Any, Tuple
-import json
+from typing import Dict, List, Optional, Any, Tuple, Union, Iterator, Deque
+from collections import deque
+import functools
+
+import numpy as np
+
+
+# Functional regions the channels are divided between, in channel order
+REGION_NAMES: Tuple[str, ...] = (
+    "input_sensory",
+    "pattern_recognition",
+    "associative_memory",
+    "executive_function",
+    "creative_synthesis",
+    "ethical_evaluation",
+    "output_motor"
+)
+
+# Region ID of channels outside every region
+UNKNOWN_REGION = len(REGION_NAMES)
+
+# Normalization reciprocals: ms -> s, confidence at 50 Hz, synchrony scale
+_INV_1000 = 1.0 / 1000.0
+_INV_50 = 1.0 / 50.0
+_INV_10 = 1.0 / 10.0
+
+# Decoded response type per region ID, including UNKNOWN_REGION
+_REGION_TO_RESPONSE: Tuple[str, ...] = (
+    "unknown",             # input_sensory
+    "pattern_detected",    # pattern_recognition
+    "unknown",             # associative_memory
+    "logic_result",        # executive_function
+    "creative_output",     # creative_synthesis
+    "ethical_assessment",  # ethical_evaluation
+    "action_command",      # output_motor
+    "unknown"              # unknown
+)
+
+# Target region per outgoing signal type
+_SIGNAL_TARGET_REGIONS: Dict[str, str] = {
+    "query": "input_sensory",
+    "pattern": "pattern_recognition",
+    "logic": "executive_function",
+    "creative": "creative_synthesis",
+    "ethical": "ethical_evaluation",
+    "command": "output_motor",
+    "feedback": "associative_memory"
+}
+
+
+def _detect_sort(voltages: np.ndarray, timestamps: np.ndarray, threshold: float) -> np.ndarray:
+    """
+    Detect threshold crossings and order them by time
+    
+    Args:
+        voltages: Voltage per reading
+        timestamps: Timestamp per reading
+        threshold: Absolute voltage a spike must exceed
+        
+    Returns:
+        Indices of detected readings in stable timestamp order
+    """
+    detected = np.nonzero(np.abs(voltages) > threshold)[0]
+    return detected[np.argsort(timestamps[detected], kind="mergesort")]
+
+
+def expand_pulses(pulse_pattern: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """
+    Yield one dict per pulse of a columnar pulse pattern
+    
+    Args:
+        pulse_pattern: Pattern from MEAInterface.build_pulse_pattern
+        
+    Returns:
+        Iterator of per-pulse dicts sharing the pattern's channel list
+    """
+    channels = list(pulse_pattern.get("channels", []))
+    for timestamp in list(pulse_pattern.get("pulse_timestamps", [])):
+        yield {
+            "timestamp": float(timestamp),
+            "amplitude": pulse_pattern["amplitude"],
+            "duration": pulse_pattern["duration_ms"],
+            "channels": channels,
+            "waveform": pulse_pattern["waveform"]
+        }
 
 
 class MEAInterface:
@@ -35,25 +118,38 @@ class MEAInterface:
     reads spike trains from biological tissue.
     """
     
-    def __init__(self, channels: int = 20000, sampling_rate: float = 20000.0):
+    def __init__(self, channels: int = 20000, sampling_rate: float = 20000.0,
+                 buffer_size: int = 4096):
         """
         Initialize MEA interface
         
         Args:
             channels: Number of electrode channels (default 20,000)
             sampling_rate: Sampling rate in Hz (default 20kHz)
+            buffer_size: Entries kept in each of the input and output buffers;
+                the oldest entry is dropped when a full buffer is appended to.
+                Streaming consumers should drain buffers with popleft()
         """
         self.channels = channels
         self.sampling_rate = sampling_rate
         self.active = False
         
-        # Channel configuration
-        self.channel_map: Dict[int, str] = {}  # Maps channel ID to function
+        # Channel configuration: region ID per channel, indexing region_names
+        self.region_names = REGION_NAMES
+        self.region_ids = np.full(channels, UNKNOWN_REGION, dtype=np.int8)
+        self._region_labels = REGION_NAMES + ("unknown",)
+        self._channel_map: Optional[Dict[int, str]] = None
         self.active_channels: List[int] = []
         
+        # Pulse templates per (signal type, intensity); cleared whenever the
+        # channel layout changes
+        self._pulse_templates = functools.lru_cache(maxsize=256)(self._build_pulse_template)
+        self._index_region_channels()
+        
         # Signal processing
-        self.input_buffer: List[Dict[str, Any]] = []
-        self.output_buffer: List[Dict[str, Any]] = []
+        self.buffer_size = buffer_size
+        self.input_buffer: Deque[Dict[str, Any]] = deque(maxlen=buffer_size)
+        self.output_buffer: Deque[Dict[str, Any]] = deque(maxlen=buffer_size)
         
         # Spike sorting parameters
         self.spike_threshold = 0.05  # mV
@@ -84,26 +180,50 @@ class MEAInterface:
     def _initialize_channel_map(self) -> None:
         """Initialize channel to function mapping"""
         # Distribute channels across functional regions
-        channels_per_region = self.channels // 7
-        
-        regions = [
-            "input_sensory",
-            "pattern_recognition", 
-            "associative_memory",
-            "executive_function",
-            "creative_synthesis",
-            "ethical_evaluation",
-            "output_motor"
-        ]
-        
-        for idx, region in enumerate(regions):
+        channels_per_region = self.channels // len(self.region_names)
+        
+        for idx in range(len(self.region_names)):
             start_channel = idx * channels_per_region
-            end_channel = start_channel + channels_per_region
+            end_channel = min(start_channel + channels_per_region, self.channels)
             
-            for channel in range(start_channel, min(end_channel, self.channels)):
-                self.channel_map[channel] = region
-                self.active_channels.append(channel)
-                
+            self.region_ids[start_channel:end_channel] = idx
+            self.active_channels.extend(range(start_channel, end_channel))
+            
+        self._channel_map = None
+        self._index_region_channels()
+        
+    def _index_region_channels(self) -> None:
+        """Precompute the channels of each region for pulse targeting"""
+        self._region_channels: Dict[str, np.ndarray] = {
+            region: np.nonzero(self.region_ids == idx)[0]
+            for idx, region in enumerate(self.region_names)
+        }
+        # Limit to 100 channels per pulse; shared read-only by every pattern
+        self._region_channels_capped: Dict[str, np.ndarray] = {
+            region: channels[:100] for region, channels in self._region_channels.items()
+        }
+        for channels in self._region_channels_capped.values():
+            channels.flags.writeable = False
+        self._pulse_templates.cache_clear()
+        
+    @property
+    def channel_map(self) -> Dict[int, str]:
+        """Channel ID to region name mapping, built on first access"""
+        if self._channel_map is None:
+            mapped = np.flatnonzero(self.region_ids != UNKNOWN_REGION)
+            self._channel_map = dict(zip(mapped.tolist(),
+                                         (self.region_names[idx] for idx in self.region_ids[mapped].tolist())))
+        return self._channel_map
+        
+    def _region_id(self, channel: Any) -> int:
+        """Look up the functional region ID of a channel"""
+        # Integral floats name the same channel, as they did as channel_map keys
+        if isinstance(channel, (float, np.floating)) and float(channel).is_integer():
+            channel = int(channel)
+        if isinstance(channel, (int, np.integer)) and 0 <= channel < self.channels:
+            return int(self.region_ids[channel])
+        return UNKNOWN_REGION
+        
     def encode_digital_to_pulse(self, digital_signal: Dict[str, Any]) -> Dict[str, Any]:
         """
         Encode digital signal into electrical pulse pattern
@@ -115,18 +235,64 @@ class MEAInterface:
             Pulse pattern for MEA transmission
         """
         if not self.active:
-            return {"error": "MEA interface not active", "pulses": []}
+            return {"error": "MEA interface not active", "pulse_timestamps": np.empty(0)}
             
+        return self.transmit_pulse_pattern(self.build_pulse_pattern(digital_signal))
+        
+    def build_pulse_pattern(self, digital_signal: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the pulse pattern for a digital signal without transmitting it
+        
+        The result depends only on the signal and the channel map, so callers
+        may cache it and replay it through transmit_pulse_pattern.
+        
+        Args:
+            digital_signal: Digital query or command
+            
+        Returns:
+            Pulse pattern structure
+        """
         signal_type = digital_signal.get("type", "query")
-        data = digital_signal.get("data", {})
         intensity = digital_signal.get("intensity", 0.5)
         
         # Convert to pulse train
-        pulse_pattern = self._generate_pulse_pattern(signal_type, data, intensity)
+        return dict(self._pulse_templates(signal_type, intensity))
+        
+    def _build_pulse_template(self, signal_type: str, intensity: float) -> Dict[str, Any]:
+        """
+        Build the shared pulse pattern for a signal shape
+        
+        The pattern depends only on signal type and intensity, never on the
+        data payload, so one read-only template serves every signal of the
+        same shape.
+        
+        Args:
+            signal_type: Type of signal (query, command, feedback)
+            intensity: Signal strength (0.0 to 1.0)
+            
+        Returns:
+            Pulse pattern structure
+        """
+        template = self._generate_pulse_pattern(signal_type, {}, intensity)
+        template["pulse_timestamps"].flags.writeable = False
+        return template
+        
+    def transmit_pulse_pattern(self, pulse_pattern: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send a pulse pattern to the array
         
+        Args:
+            pulse_pattern: Pattern from build_pulse_pattern
+            
+        Returns:
+            The transmitted pulse pattern
+        """
+        if not self.active:
+            return {"error": "MEA interface not active", "pulse_timestamps": np.empty(0)}
+            
         # Add to input buffer
         self.input_buffer.append(pulse_pattern)
-        self.total_spikes_sent += len(pulse_pattern.get("pulses", []))
+        self.total_spikes_sent += len(pulse_pattern.get("pulse_timestamps", ()))
         
         return pulse_pattern
         
@@ -141,12 +307,13 @@ class MEAInterface:
             intensity: Signal strength (0.0 to 1.0)
             
         Returns:
-            Pulse pattern structure
+            Pulse pattern structure with one timestamp per pulse; amplitude,
+            duration, channels and waveform are shared by every pulse
         """
         # Determine target channels based on signal type
         target_region = self._select_target_region(signal_type)
-        target_channels = [ch for ch, region in self.channel_map.items() 
-                          if region == target_region]
+        target_channels = self._region_channels[target_region]
+        pulse_channels = self._region_channels_capped[target_region]
         
         # Calculate pulse frequency (10-100Hz range)
         base_frequency = 10.0  # Hz
@@ -156,44 +323,31 @@ class MEAInterface:
         duration = 100.0  # ms
         num_pulses = int((frequency * duration) / 1000.0)
         
-        pulses = []
-        for i in range(num_pulses):
-            pulse = {
-                "timestamp": i * (duration / num_pulses),  # ms
-                "amplitude": intensity * 0.1,  # mV (0-100 µV)
-                "duration": 1.0,  # ms
-                "channels": target_channels[:min(100, len(target_channels))],  # Limit to 100 channels per pulse
-                "waveform": "biphasic"
-            }
-            pulses.append(pulse)
-            
+        interval = duration / num_pulses if num_pulses > 0 else 0.0
+        
         return {
             "signal_type": signal_type,
             "target_region": target_region,
             "frequency": frequency,
-            "pulses": pulses,
+            "pulse_timestamps": np.arange(max(num_pulses, 0)) * interval,  # ms
+            "amplitude": intensity * 0.1,  # mV (0-100 µV)
+            "duration_ms": 1.0,
+            "channels": pulse_channels,
+            "waveform": "biphasic",
             "num_channels": len(target_channels)
         }
         
     def _select_target_region(self, signal_type: str) -> str:
         """Select target brain region based on signal type"""
-        region_map = {
-            "query": "input_sensory",
-            "pattern": "pattern_recognition",
-            "logic": "executive_function",
-            "creative": "creative_synthesis",
-            "ethical": "ethical_evaluation",
-            "command": "output_motor",
-            "feedback": "associative_memory"
-        }
-        return region_map.get(signal_type, "input_sensory")
+        return _SIGNAL_TARGET_REGIONS.get(signal_type, "input_sensory")
         
-    def decode_spike_train(self, raw_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def decode_spike_train(self, raw_data: Union[List[Dict[str, Any]], np.ndarray]) -> Dict[str, Any]:
         """
         Decode spike train from biological tissue into digital signal
         
         Args:
-            raw_data: Raw electrode readings or spike data
+            raw_data: Raw electrode readings or spike data, either as a list of
+                dicts or a structured array with channel/voltage/timestamp fields
             
         Returns:
             Decoded digital signal
@@ -202,33 +356,78 @@ class MEAInterface:
             return {"error": "MEA interface not active", "decoded": False}
         
         # Handle empty or invalid input
-        if not raw_data:
-            return {
-                "decoded": True,
-                "confidence": 0.0,
-                "response_type": "none",
-                "firing_rate": 0.0,
-                "synchrony": 0.0,
-                "active_regions": 0,
-                "data": {"patterns": [], "dominant_region": "none"}
-            }
+        if len(raw_data) == 0:
+            return self._empty_decode()
         
         # Perform spike sorting
-        sorted_spikes = self._sort_spikes(raw_data)
+        return self._decode_sorted(*self._sort_spikes(raw_data))
+        
+    def decode_spike_train_batch(self, channels: np.ndarray, voltages: np.ndarray,
+                                 timestamps: np.ndarray) -> Dict[str, Any]:
+        """
+        Decode a spike train given as parallel per-reading arrays
+        
+        This is the fast path for bulk electrode data: detection, ordering
+        and region lookup all run over the arrays, with no per-reading
+        Python objects.
+        
+        Args:
+            channels: Channel ID per reading
+            voltages: Voltage per reading (mV)
+            timestamps: Timestamp per reading (ms)
+            
+        Returns:
+            Decoded digital signal
+        """
+        if not self.active:
+            return {"error": "MEA interface not active", "decoded": False}
         
+        voltages = np.asarray(voltages)
+        if len(voltages) == 0:
+            return self._empty_decode()
+            
+        return self._decode_sorted(*self._detect_spikes(np.asarray(channels), voltages,
+                                                        np.asarray(timestamps)))
+        
+    def _empty_decode(self) -> Dict[str, Any]:
+        """Decoded signal for a spike train with no readings"""
+        return {
+            "decoded": True,
+            "confidence": 0.0,
+            "response_type": "none",
+            "firing_rate": 0.0,
+            "synchrony": 0.0,
+            "active_regions": 0,
+            "data": {"patterns": [], "dominant_region": "none"}
+        }
+        
+    def _decode_sorted(self, region_ids: np.ndarray, timestamps: np.ndarray,
+                       amplitudes: np.ndarray) -> Dict[str, Any]:
+        """
+        Decode detected spikes and record the result
+        
+        Args:
+            region_ids: Region ID per spike
+            timestamps: Spike timestamps in ms, ascending
+            amplitudes: Spike amplitudes
+            
+        Returns:
+            Decoded digital signal
+        """
         # Extract patterns
-        patterns = self._extract_patterns(sorted_spikes)
+        patterns, pattern_regions = self._extract_patterns(region_ids, timestamps, amplitudes)
         
         # Decode into digital representation
-        decoded = self._pattern_to_digital(patterns)
+        decoded = self._pattern_to_digital(patterns, pattern_regions)
         
         # Add to output buffer
         self.output_buffer.append(decoded)
-        self.total_spikes_received += len(sorted_spikes)
+        self.total_spikes_received += len(timestamps)
         
         return decoded
         
-    def _sort_spikes(self, raw_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _sort_spikes(self, raw_data: Union[List[Dict[str, Any]], np.ndarray]
+                     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
         Sort and classify spikes from raw electrode data
         
@@ -236,103 +435,184 @@ class MEAInterface:
             raw_data: Raw voltage readings from electrodes
             
         Returns:
-            Sorted and classified spikes
+            Region IDs, timestamps and amplitudes of detected spikes,
+            ordered by timestamp
         """
-        sorted_spikes = []
+        if isinstance(raw_data, np.ndarray):
+            return self._sort_spike_array(raw_data)
+            
+        region_ids = []
+        timestamps = []
+        amplitudes = []
         
         for reading in raw_data:
-            channel = reading.get("channel", 0)
             voltage = reading.get("voltage", 0.0)
-            timestamp = reading.get("timestamp", 0.0)
             
             # Detect spike if voltage exceeds threshold
             if abs(voltage) > self.spike_threshold:
-                spike = {
-                    "channel": channel,
-                    "timestamp": timestamp,
-                    "amplitude": voltage,
-                    "region": self.channel_map.get(channel, "unknown"),
-                    "classified": True
-                }
-                sorted_spikes.append(spike)
+                region_ids.append(self._region_id(reading.get("channel", 0)))
+                timestamps.append(reading.get("timestamp", 0.0))
+                amplitudes.append(voltage)
                 
         # Sort by timestamp
-        sorted_spikes.sort(key=lambda x: x["timestamp"])
+        timestamps = np.array(timestamps, dtype=np.float64)
+        order = np.argsort(timestamps, kind="stable")
         
-        return sorted_spikes
+        return (np.array(region_ids, dtype=np.int8)[order],
+                timestamps[order],
+                np.array(amplitudes, dtype=np.float64)[order])
         
-    def _extract_patterns(self, spikes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _sort_spike_array(self, raw_data: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Sort and classify spikes from a structured array of readings
+        
+        Missing fields default the same way the list path does.
+        
+        Args:
+            raw_data: Structured array with channel/voltage/timestamp fields
+            
+        Returns:
+            Region IDs, timestamps and amplitudes of detected spikes,
+            ordered by timestamp
+        """
+        fields = raw_data.dtype.names or ()
+        if "voltage" not in fields:
+            return (np.empty(0, dtype=np.int8), np.empty(0), np.empty(0))
+            
+        voltages = raw_data["voltage"]
+        timestamps = raw_data["timestamp"] if "timestamp" in fields else np.zeros(len(raw_data))
+        channels = raw_data["channel"] if "channel" in fields else np.zeros(len(raw_data), dtype=np.int64)
+        return self._detect_spikes(channels, voltages, timestamps)
+        
+    def _detect_spikes(self, channels: np.ndarray, voltages: np.ndarray,
+                       timestamps: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Detect, order and classify spikes from per-reading arrays
+        
+        Args:
+            channels: Channel ID per reading
+            voltages: Voltage per reading
+            timestamps: Timestamp per reading
+            
+        Returns:
+            Region IDs, timestamps and amplitudes of detected spikes,
+            ordered by timestamp
+        """
+        detected = _detect_sort(voltages, timestamps, self.spike_threshold)
+        channels = channels[detected]
+        
+        if np.issubdtype(channels.dtype, np.integer):
+            in_range = (channels >= 0) & (channels < self.channels)
+            region_ids = np.full(len(channels), UNKNOWN_REGION, dtype=np.int8)
+            region_ids[in_range] = self.region_ids[channels[in_range]]
+        else:
+            region_ids = np.array([self._region_id(channel) for channel in channels.tolist()],
+                                  dtype=np.int8)
+        
+        return (region_ids,
+                timestamps[detected].astype(np.float64, copy=False),
+                voltages[detected].astype(np.float64, copy=False))
+        
+    def _extract_patterns(self, region_ids: np.ndarray, timestamps: np.ndarray,
+                          amplitudes: np.ndarray) -> Tuple[List[Dict[str, Any]], List[int]]:
         """
         Extract temporal patterns from spike train
         
+        Spikes are grouped by a stable sort on region, leaving each region
+        as a contiguous, time-ordered segment whose statistics are reduced
+        with bincount.
+        
         Args:
-            spikes: Sorted spike data
+            region_ids: Region ID per spike
+            timestamps: Spike timestamps in ms, ascending
+            amplitudes: Spike amplitudes
             
         Returns:
-            Identified patterns
+            Identified patterns, in order of each region's first spike, and
+            the region ID of each pattern
         """
+        if len(region_ids) < 2:
+            return [], []
+            
+        # Group spikes by region
+        order = np.argsort(region_ids, kind="stable")
+        grouped = region_ids[order]
+        timestamps = timestamps[order]
+        starts = np.flatnonzero(np.r_[True, grouped[1:] != grouped[:-1]])
+        ends = np.r_[starts[1:], len(grouped)]
+        counts = ends - starts
+        segment = np.repeat(np.arange(len(starts)), counts)
+        
+        # Per-region amplitude sums and time spans
+        amplitude_sums = np.bincount(segment, weights=amplitudes[order], minlength=len(starts))
+        time_spans = timestamps[ends - 1] - timestamps[starts]
+        synchrony = self._calculate_synchrony(timestamps, segment, counts)
+        
         patterns = []
+        pattern_regions = []
         
-        # Group spikes by region
-        region_groups: Dict[str, List[Dict[str, Any]]] = {}
-        for spike in spikes:
-            region = spike["region"]
-            if region not in region_groups:
-                region_groups[region] = []
-            region_groups[region].append(spike)
-            
         # Analyze each region's activity
-        for region, region_spikes in region_groups.items():
-            if len(region_spikes) < 2:
+        for idx in np.argsort(order[starts], kind="stable").tolist():
+            spike_count = int(counts[idx])
+            if spike_count < 2:
                 continue
                 
             # Calculate firing rate
-            time_span = region_spikes[-1]["timestamp"] - region_spikes[0]["timestamp"]
-            firing_rate = len(region_spikes) / (time_span / 1000.0) if time_span > 0 else 0
-            
-            # Calculate synchrony (simplified)
-            avg_amplitude = sum(s["amplitude"] for s in region_spikes) / len(region_spikes)
+            time_span = float(time_spans[idx])
+            firing_rate = spike_count / (time_span * _INV_1000) if time_span > 0 else 0
             
+            region_id = int(grouped[starts[idx]])
             pattern = {
-                "region": region,
-                "spike_count": len(region_spikes),
+                "region": self._region_labels[region_id],
+                "spike_count": spike_count,
                 "firing_rate": firing_rate,
-                "avg_amplitude": avg_amplitude,
-                "synchrony": self._calculate_synchrony(region_spikes),
-                "confidence": min(1.0, firing_rate / 50.0)  # Normalize to 0-1
+                "avg_amplitude": float(amplitude_sums[idx]) / spike_count,
+                "synchrony": float(synchrony[idx]),
+                "confidence": min(1.0, firing_rate * _INV_50)  # Normalize to 0-1
             }
             patterns.append(pattern)
+            pattern_regions.append(region_id)
             
-        return patterns
+        return patterns, pattern_regions
         
-    def _calculate_synchrony(self, spikes: List[Dict[str, Any]]) -> float:
-        """Calculate synchrony measure for spike train"""
-        if len(spikes) < 2:
-            return 0.0
-            
-        # Calculate inter-spike intervals
-        intervals = []
-        for i in range(len(spikes) - 1):
-            interval = spikes[i + 1]["timestamp"] - spikes[i]["timestamp"]
-            intervals.append(interval)
+    def _calculate_synchrony(self, timestamps: np.ndarray, segment: np.ndarray,
+                             counts: np.ndarray) -> np.ndarray:
+        """
+        Calculate synchrony measure for each region's spike train
+        
+        Args:
+            timestamps: Spike timestamps grouped by region, each region
+                time-ordered
+            segment: Region segment index per spike
+            counts: Spikes per segment
             
+        Returns:
+            Synchrony per segment (0-1); segments with fewer than two
+            spikes score 0.0
+        """
+        # Inter-spike intervals, dropping the ones that span two regions
+        same_region = segment[1:] == segment[:-1]
+        interval_segment = segment[1:][same_region]
+        intervals = np.diff(timestamps)[same_region]
+        
         # Synchrony is inversely related to interval variance
-        if not intervals:
-            return 0.0
-            
-        avg_interval = sum(intervals) / len(intervals)
-        variance = sum((x - avg_interval) ** 2 for x in intervals) / len(intervals)
+        interval_counts = np.maximum(counts - 1, 1)
+        means = np.bincount(interval_segment, weights=intervals, minlength=len(counts)) / interval_counts
+        deviations = intervals - means[interval_segment]
+        variances = np.bincount(interval_segment, weights=deviations * deviations,
+                                minlength=len(counts)) / interval_counts
         
         # Normalize to 0-1 scale
-        synchrony = 1.0 / (1.0 + variance / 10.0)
-        return synchrony
+        return np.where(counts >= 2, 1.0 / (1.0 + variances * _INV_10), 0.0)
         
-    def _pattern_to_digital(self, patterns: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _pattern_to_digital(self, patterns: List[Dict[str, Any]],
+                            pattern_regions: List[int]) -> Dict[str, Any]:
         """
         Convert biological patterns to digital representation
         
         Args:
             patterns: Extracted neural patterns
+            pattern_regions: Region ID of each pattern
             
         Returns:
             Digital signal representation
@@ -346,18 +626,11 @@ class MEAInterface:
             }
             
         # Find dominant pattern
-        dominant = max(patterns, key=lambda p: p["confidence"])
+        best = max(range(len(patterns)), key=lambda i: patterns[i]["confidence"])
+        dominant = patterns[best]
         
         # Map region to response type
-        response_map = {
-            "pattern_recognition": "pattern_detected",
-            "executive_function": "logic_result",
-            "creative_synthesis": "creative_output",
-            "ethical_evaluation": "ethical_assessment",
-            "output_motor": "action_command"
-        }
-        
-        response_type = response_map.get(dominant["region"], "unknown")
+        response_type = _REGION_TO_RESPONSE[pattern_regions[best]]
         
         return {
             "decoded": True,
@@ -404,6 +677,7 @@ class MEAInterface:
         # Clear buffers
         self.input_buffer.clear()
         self.output_buffer.clear()
+        self._pulse_templates.cache_clear()
         
         self.active = False
         return True
@@ -22,10 +22,142 @@ Represents the biological computing substrate:
 - Spike train processing
 """
 
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, Deque
+from collections import deque
+import functools
 import json
+import math
 from datetime import datetime
 
+import numpy as np
+
+
+# Output channels a lobe can emit on; spike arrays store an index into this
+OUTPUT_CHANNELS = (
+    "general_output", "pattern_output", "logic_output",
+    "creative_output", "governance_output"
+)
+
+# Synaptic connection that drives each stimulus type
+_WEIGHT_MAP: Dict[str, str] = {
+    "pattern": "pattern_recognition",
+    "logic": "executive_function",
+    "creative": "creative_synthesis",
+    "ethical": "ethical_evaluation"
+}
+
+# Output channel each stimulus type is reported on
+_CHANNEL_MAP: Dict[str, str] = {
+    "pattern": "pattern_output",
+    "logic": "logic_output",
+    "creative": "creative_output",
+    "ethical": "governance_output"
+}
+
+# Simplified representation of synaptic connections
+_BASE_CONNECTIONS = (
+    "input_sensory", "pattern_recognition", "associative_memory",
+    "executive_function", "creative_synthesis", "ethical_evaluation",
+    "output_motor"
+)
+
+# Initial synaptic weights for each lobe type: every connection starts at
+# 0.5 except the one the lobe specializes in
+_DEFAULT_WEIGHT_PROFILE: Dict[str, float] = dict.fromkeys(_BASE_CONNECTIONS, 0.5)
+_LOBE_WEIGHT_PROFILES: Dict[str, Dict[str, float]] = {
+    "logic": {**_DEFAULT_WEIGHT_PROFILE, "executive_function": 0.7},
+    "abstract": {**_DEFAULT_WEIGHT_PROFILE, "creative_synthesis": 0.8},
+    "governance": {**_DEFAULT_WEIGHT_PROFILE, "ethical_evaluation": 0.9}
+}
+
+# Starting neural density for each lobe type
+_INITIAL_DENSITIES: Dict[str, float] = {
+    "logic": 0.65,
+    "abstract": 0.70,
+    "governance": 0.75
+}
+
+# Packed record for spike trains: 10 bytes per spike. channel is an index
+# into OUTPUT_CHANNELS, not an MEA electrode ID, and amplitude is not an
+# electrode voltage; map channels to electrodes before handing a train to
+# MEAInterface.decode_spike_train
+SPIKE_DTYPE = np.dtype([
+    ("timestamp", np.float32),  # ms
+    ("amplitude", np.float32),
+    ("channel", np.int16)       # index into OUTPUT_CHANNELS
+])
+
+# Shared spike train for responses that fire nothing
+NO_SPIKES = np.empty(0, dtype=SPIKE_DTYPE)
+NO_SPIKES.flags.writeable = False
+
+
+def _spike_kernel(num_spikes: int, intensity: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute spike timestamps and amplitudes across a 100 ms window
+    
+    Args:
+        num_spikes: Number of spikes, at least 1
+        intensity: Stimulus intensity
+        
+    Returns:
+        Timestamps (ms) and amplitudes, evenly spaced with a rising ramp
+    """
+    index = np.arange(num_spikes).astype(np.float64)
+    timestamps = index * (100.0 / num_spikes)
+    amplitudes = intensity * (0.8 + 0.4 * (index / num_spikes))
+    return timestamps, amplitudes
+
+
+@functools.lru_cache(maxsize=256)
+def _spike_template(num_spikes: int, intensity: float,
+                    channel: int) -> Tuple[np.ndarray, float, float, float]:
+    """
+    Build the shared spike train for a response shape
+    
+    A spike train depends only on its spike count, the stimulus intensity
+    and the output channel, so repeated stimuli of the same shape reuse one
+    read-only record array instead of rerunning the kernel. Everything else
+    derived from the train alone (confidence, STDP trace sums) is cached
+    with it.
+    
+    Args:
+        num_spikes: Number of spikes, at least 1
+        intensity: Stimulus intensity
+        channel: Index into OUTPUT_CHANNELS
+        
+    Returns:
+        Read-only spike train, its confidence score and its LTP and
+        postsynaptic trace sums
+    """
+    timestamps, amplitudes = _spike_kernel(num_spikes, intensity)
+    
+    spikes = np.empty(num_spikes, dtype=SPIKE_DTYPE)
+    spikes["timestamp"] = timestamps
+    spikes["amplitude"] = amplitudes
+    spikes["channel"] = channel
+    spikes.flags.writeable = False
+    ltp_sum, post_sum = OrganoidCore._stdp_sums(spikes)
+    return spikes, OrganoidCore._calculate_confidence(amplitudes), ltp_sum, post_sum
+
+
+def spikes_to_dicts(spikes: np.ndarray) -> List[Dict[str, Any]]:
+    """
+    Expand a SPIKE_DTYPE spike train into per-spike dicts
+    
+    Args:
+        spikes: Spike train record array
+        
+    Returns:
+        List of dicts with timestamp, amplitude and channel name
+    """
+    return [
+        {"timestamp": timestamp, "amplitude": amplitude, "channel": OUTPUT_CHANNELS[channel]}
+        for timestamp, amplitude, channel in zip(spikes["timestamp"].tolist(),
+                                                 spikes["amplitude"].tolist(),
+                                                 spikes["channel"].tolist())
+    ]
+
 
 class OrganoidCore:
     """
@@ -40,13 +172,34 @@ class OrganoidCore:
     - Governance Lobe (Parietal): Prime Directive enforcement and ethical weighting
     """
     
-    def __init__(self, organoid_id: str, lobe_type: str = "logic"):
+    __slots__ = (
+        "organoid_id", "lobe_type", "active", "health_status",
+        "synaptic_weights", "_primary_weight_key", "neural_density",
+        "plasticity_coefficient", "_pre_trace", "_post_trace",
+        "current_spike_train", "processing_queue",
+        "accuracy_score", "creativity_index", "ethical_alignment",
+        "_response_template"
+    )
+    
+    # STDP parameters; each stimulus is one window of STDP_WINDOW_MS
+    STDP_WINDOW_MS = 100.0
+    STDP_A_PLUS = 0.01  # LTP amplitude
+    STDP_A_MINUS = 0.01  # LTD amplitude
+    STDP_TAU_PLUS = 20.0  # LTP time constant (ms)
+    STDP_TAU_MINUS = 20.0  # LTD time constant (ms)
+    
+    # Trace decay across one full window
+    _PRE_WINDOW_DECAY = math.exp(-STDP_WINDOW_MS / STDP_TAU_PLUS)
+    _POST_WINDOW_DECAY = math.exp(-STDP_WINDOW_MS / STDP_TAU_MINUS)
+    
+    def __init__(self, organoid_id: str, lobe_type: str = "logic", queue_size: int = 1024):
         """
         Initialize an organoid core instance
         
         Args:
             organoid_id: Unique identifier for this organoid
             lobe_type: Type of specialized lobe (logic, abstract, governance)
+            queue_size: Number of recent stimuli kept in the processing queue
         """
         self.organoid_id = organoid_id
         self.lobe_type = lobe_type
@@ -55,12 +208,26 @@ class OrganoidCore:
         
         # Neural state
         self.synaptic_weights: Dict[str, float] = {}
+        self._primary_weight_key: Optional[str] = None
         self.neural_density = 0.0
         self.plasticity_coefficient = 1.0
         
+        # STDP synaptic traces: presynaptic (stimulus) and postsynaptic (spikes)
+        self._pre_trace: float = 0.0
+        self._post_trace: float = 0.0
+        
         # Processing state
-        self.current_spike_train: List[Dict[str, Any]] = []
-        self.processing_queue: List[Dict[str, Any]] = []
+        self.current_spike_train: np.ndarray = NO_SPIKES
+        self.processing_queue: Deque[Dict[str, Any]] = deque(maxlen=queue_size)
+        
+        # Identity fields of every response; copied and filled per stimulus
+        self._response_template: Dict[str, Any] = {
+            "organoid_id": organoid_id,
+            "lobe_type": lobe_type,
+            "spikes": NO_SPIKES,
+            "firing_rate": 0.0,
+            "confidence": 0.0
+        }
         
         # Performance metrics
         self.accuracy_score = 0.0
@@ -89,32 +256,15 @@ class OrganoidCore:
         
     def _initialize_synaptic_weights(self) -> None:
         """Initialize default synaptic connection weights"""
-        # Simplified representation of synaptic connections
-        base_connections = [
-            "input_sensory", "pattern_recognition", "associative_memory",
-            "executive_function", "creative_synthesis", "ethical_evaluation",
-            "output_motor"
-        ]
-        
-        for connection in base_connections:
-            # Different lobes have different initial weight distributions
-            if self.lobe_type == "logic":
-                self.synaptic_weights[connection] = 0.7 if "executive" in connection else 0.5
-            elif self.lobe_type == "abstract":
-                self.synaptic_weights[connection] = 0.8 if "creative" in connection else 0.5
-            elif self.lobe_type == "governance":
-                self.synaptic_weights[connection] = 0.9 if "ethical" in connection else 0.5
-            else:
-                self.synaptic_weights[connection] = 0.5
+        self._primary_weight_key = _BASE_CONNECTIONS[0]
+        
+        # Different lobes have different initial weight distributions
+        self.synaptic_weights.update(
+            _LOBE_WEIGHT_PROFILES.get(self.lobe_type, _DEFAULT_WEIGHT_PROFILE))
                 
     def _get_initial_density(self) -> float:
         """Get initial neural density based on lobe type"""
-        densities = {
-            "logic": 0.65,
-            "abstract": 0.70,
-            "governance": 0.75
-        }
-        return densities.get(self.lobe_type, 0.60)
+        return _INITIAL_DENSITIES.get(self.lobe_type, 0.60)
         
     def process_stimulus(self, stimulus: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -129,32 +279,52 @@ class OrganoidCore:
         if not self.active:
             return {"error": "Organoid not active", "spike_train": []}
             
-        # Add to processing queue
-        self.processing_queue.append(stimulus)
+        stimulus_type = stimulus.get("type", "unknown")
+        return self._respond(stimulus, stimulus_type, stimulus.get("intensity", 0.5),
+                             OUTPUT_CHANNELS.index(self._select_output_channel(stimulus_type)))
         
-        # Generate spike train response based on stimulus and synaptic weights
-        response = self._generate_spike_train(stimulus)
+    @staticmethod
+    def process_batch(organoids: List["OrganoidCore"],
+                      stimulus: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Process one stimulus through several organoids at once
         
-        # Update current spike train
-        self.current_spike_train = response["spikes"]
+        The stimulus type, intensity and output channel are resolved once
+        for the whole batch. Each organoid then responds exactly as
+        process_stimulus would, with the same shared spike trains.
         
-        # Apply STDP (Spike-Timing-Dependent Plasticity) for learning
-        self._apply_stdp(stimulus, response)
+        Args:
+            organoids: Organoids to drive with the stimulus
+            stimulus: Input stimulus containing pattern data
+            
+        Returns:
+            One response dict per organoid, in input order
+        """
+        stimulus_type = stimulus.get("type", "unknown")
+        intensity = stimulus.get("intensity", 0.5)
+        channel = OUTPUT_CHANNELS.index(_CHANNEL_MAP.get(stimulus_type, "general_output"))
         
-        return response
+        # Inactive organoids only report an error
+        return [organoid._respond(stimulus, stimulus_type, intensity, channel)
+                if organoid.active else organoid.process_stimulus(stimulus)
+                for organoid in organoids]
         
-    def _generate_spike_train(self, stimulus: Dict[str, Any]) -> Dict[str, Any]:
+    def _respond(self, stimulus: Dict[str, Any], stimulus_type: str,
+                 intensity: float, channel: int) -> Dict[str, Any]:
         """
-        Generate neural spike train response to stimulus
+        Fire the response to a stimulus and learn from it
         
         Args:
-            stimulus: Input pattern
+            stimulus: Input stimulus, queued as received
+            stimulus_type: Type of the stimulus
+            intensity: Stimulus intensity
+            channel: Index into OUTPUT_CHANNELS for the response spikes
             
         Returns:
-            Spike train data structure
+            Dict containing spike train response
         """
-        stimulus_type = stimulus.get("type", "unknown")
-        intensity = stimulus.get("intensity", 0.5)
+        # Add to processing queue
+        self.processing_queue.append(stimulus)
         
         # Calculate firing rate based on synaptic weights and stimulus
         base_rate = 10.0  # Hz
@@ -162,74 +332,102 @@ class OrganoidCore:
         
         # Generate spike sequence (simplified)
         num_spikes = int(modulated_rate * 0.1)  # 100ms window
-        spikes = []
-        
-        for i in range(num_spikes):
-            spike = {
-                "timestamp": i * (100.0 / num_spikes),  # ms
-                "amplitude": intensity * (0.8 + 0.4 * (i / max(num_spikes, 1))),
-                "channel": self._select_output_channel(stimulus_type)
-            }
-            spikes.append(spike)
+        
+        if num_spikes > 0:
+            # Spikes are stored as one packed record array; callers that need
+            # per-spike dicts can expand it with spikes_to_dicts
+            spikes, confidence, ltp_sum, post_sum = _spike_template(
+                num_spikes, float(intensity), channel)
+        else:
+            # Nothing fires: no kernel call, no allocation
+            spikes, confidence, ltp_sum, post_sum = NO_SPIKES, 0.0, 0.0, 0.0
             
-        return {
-            "organoid_id": self.organoid_id,
-            "lobe_type": self.lobe_type,
-            "spikes": spikes,
-            "firing_rate": modulated_rate,
-            "confidence": self._calculate_confidence(spikes)
-        }
+        # Update current spike train
+        self.current_spike_train = spikes
+        
+        # Apply STDP (Spike-Timing-Dependent Plasticity) for learning
+        self._apply_stdp(stimulus_type, ltp_sum, post_sum)
+        
+        response = self._response_template.copy()
+        response["spikes"] = spikes
+        response["firing_rate"] = modulated_rate
+        response["confidence"] = confidence
+        return response
         
     def _get_weight_for_stimulus(self, stimulus_type: str) -> float:
         """Get appropriate synaptic weight for stimulus type"""
-        weight_map = {
-            "pattern": "pattern_recognition",
-            "logic": "executive_function",
-            "creative": "creative_synthesis",
-            "ethical": "ethical_evaluation"
-        }
-        
-        connection = weight_map.get(stimulus_type, "input_sensory")
+        connection = _WEIGHT_MAP.get(stimulus_type, "input_sensory")
         return self.synaptic_weights.get(connection, 0.5)
         
     def _select_output_channel(self, stimulus_type: str) -> str:
         """Select appropriate output channel based on processing"""
-        channel_map = {
-            "pattern": "pattern_output",
-            "logic": "logic_output",
-            "creative": "creative_output",
-            "ethical": "governance_output"
-        }
-        return channel_map.get(stimulus_type, "general_output")
+        return _CHANNEL_MAP.get(stimulus_type, "general_output")
         
-    def _calculate_confidence(self, spikes: List[Dict[str, Any]]) -> float:
-        """Calculate confidence score based on spike train characteristics"""
-        if not spikes:
+    @staticmethod
+    def _calculate_confidence(amplitudes: np.ndarray) -> float:
+        """Calculate confidence score based on spike train amplitudes"""
+        if amplitudes.size == 0:
             return 0.0
             
-        # Confidence based on spike count and amplitude consistency
-        avg_amplitude = sum(s["amplitude"] for s in spikes) / len(spikes)
-        return min(1.0, avg_amplitude * len(spikes) / 10.0)
+        # Confidence based on spike count and amplitude consistency; the
+        # mean amplitude times the spike count is the amplitude sum
+        return min(1.0, float(amplitudes.sum()) / 10.0)
+        
+    @classmethod
+    def _stdp_sums(cls, spikes: np.ndarray) -> Tuple[float, float]:
+        """
+        Sum a spike train's contributions to the STDP traces
+        
+        Args:
+            spikes: Non-empty spike train record array
+            
+        Returns:
+            Sum of presynaptic-trace factors at each spike (LTP) and the
+            spikes' postsynaptic trace at the end of the window
+        """
+        timestamps = spikes["timestamp"].astype(np.float64)
+        ltp_sum = float(np.exp(timestamps * (-1.0 / cls.STDP_TAU_PLUS)).sum())
+        post_sum = float(np.exp(
+            (timestamps - cls.STDP_WINDOW_MS) * (1.0 / cls.STDP_TAU_MINUS)).sum())
+        return ltp_sum, post_sum
         
-    def _apply_stdp(self, stimulus: Dict[str, Any], response: Dict[str, Any]) -> None:
+    def _apply_stdp(self, stimulus_type: str, ltp_sum: float, post_sum: float) -> None:
         """
         Apply Spike-Timing-Dependent Plasticity for learning
         
         Strengthens or weakens synaptic connections based on spike timing
-        """
-        confidence = response.get("confidence", 0.5)
-        stimulus_type = stimulus.get("type", "unknown")
         
-        # Find relevant connection
-        connection = self._get_weight_for_stimulus(stimulus_type)
+        Uses the online trace form of pair-based STDP: the stimulus is the
+        presynaptic event at the start of the window and the response spikes
+        are postsynaptic events. Two exponentially decaying traces summarize
+        all earlier spikes, so no spike history is kept.
         
-        # Update synaptic weight based on response confidence
-        if stimulus_type in ["pattern", "logic", "creative", "ethical"]:
-            weight_key = list(self.synaptic_weights.keys())[0]  # Simplified
+        Args:
+            stimulus_type: Type of the stimulus just processed
+            ltp_sum: LTP sum of the response spike train (see _stdp_sums)
+            post_sum: Postsynaptic trace sum of the response spike train
+        """
+        # Stimulus arrives: depress by the trace of earlier postsynaptic
+        # spikes (stored already carried to this window's start), then
+        # record the presynaptic event
+        pre_trace = self._pre_trace * self._PRE_WINDOW_DECAY + 1.0
+        delta = -self.STDP_A_MINUS * self._post_trace
+        
+        # Response spikes: potentiate by the presynaptic trace at each spike
+        if ltp_sum:
+            delta += self.STDP_A_PLUS * pre_trace * ltp_sum
+            
+        # Carry the postsynaptic trace to the end of the window, which is
+        # the start of the next one
+        self._pre_trace = pre_trace
+        self._post_trace = self._post_trace * self._POST_WINDOW_DECAY + post_sum
+        
+        # Update synaptic weight from the spike-timing correlation
+        if stimulus_type in _WEIGHT_MAP:
+            weight_key = self._primary_weight_key  # Simplified
             current_weight = self.synaptic_weights.get(weight_key, 0.5)
             
-            # STDP rule: increase weight if confident, decrease if not
-            delta = (confidence - 0.5) * self.plasticity_coefficient * 0.01
+            delta *= self.plasticity_coefficient
             new_weight = max(0.1, min(1.0, current_weight + delta))
             
             self.synaptic_weights[weight_key] = new_weight
@@ -291,7 +489,9 @@ class OrganoidCore:
             
         # Clear processing queue
         self.processing_queue.clear()
-        self.current_spike_train.clear()
+        self.current_spike_train = NO_SPIKES
+        self._pre_trace = 0.0
+        self._post_trace = 0.0
         
         self.active = False
         self.health_status = "dormant"
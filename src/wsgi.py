@@ -0,0 +1,28 @@
+"""
+© 2026 Tony Ray Macier III. All rights reserved.
+
+Thalos Prime™ is a proprietary system.
+"""
+
+"""
+WSGI entry point for the Thalos Prime web interface
+
+Run under gunicorn from the src directory:
+
+    gunicorn -k gthread -w 4 --threads 4 -b 0.0.0.0:8000 --preload wsgi:app
+
+--preload boots CIS, the wetware core and the neural network once in the
+master before workers fork, so their memory is shared copy-on-write.
+Background threads start in each worker on its first request. Each worker
+then owns an independent copy of the simulation state; use -w 1 with more
+--threads when a single shared simulation is required.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from interfaces.web.web_server import app
+
+__all__ = ['app']
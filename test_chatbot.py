@@ -10,13 +10,15 @@ Chatbot Test Suite - Test all capabilities
 import sys
 import os
 
+import numpy as np
+
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from core.cis import CIS
 from wetware.organoid_core import OrganoidCore
 from wetware.mea_interface import MEAInterface
 from wetware.life_support import LifeSupport
-from ai.neural.bio_neural_network import BioNeuralNetwork
+from ai.neural.bio_neural_network import BioNeuralNetwork, STATE_DTYPE
 from ai.learning.reinforcement_learner import ReinforcementLearner
 from database.connection_manager import DatabaseManager
 from interfaces.web.nlp_processor import NLPProcessor
@@ -313,17 +315,17 @@ def test_wetware_integration(system):
         }
         
         pulse_pattern = system['mea'].encode_digital_to_pulse(digital_signal)
-        print(f"Pulses generated: {len(pulse_pattern.get('pulses', []))}")
+        print(f"Pulses generated: {len(pulse_pattern.get('pulse_timestamps', []))}")
         
         # Process through each organoid
         total_spikes = 0
-        for org in system['organoids']:
-            stimulus = {
-                'type': 'pattern',
-                'intensity': 0.8,
-                'data': pulse_pattern
-            }
-            response = org.process_stimulus(stimulus)
+        stimulus = {
+            'type': 'pattern',
+            'intensity': 0.8,
+            'data': pulse_pattern
+        }
+        responses = OrganoidCore.process_batch(system['organoids'], stimulus)
+        for org, response in zip(system['organoids'], responses):
             spikes = len(response.get('spikes', []))
             total_spikes += spikes
             print(f"{org.lobe_type} lobe: {spikes} spikes, confidence: {response['confidence']:.2f}")
@@ -381,12 +383,13 @@ def test_learning_adaptation(system):
     
     print("Training neural network with patterns...")
     
-    # Train with patterns
-    patterns = [
+    # Train with patterns; built in the network's state dtype so
+    # stimulate_inputs uses them without a conversion
+    patterns = np.array([
         [0.8, 0.2, 0.5, 0.7, 0.3, 0.9, 0.1, 0.6, 0.4, 0.8],
         [0.1, 0.9, 0.3, 0.7, 0.5, 0.2, 0.8, 0.4, 0.6, 0.3],
         [0.5, 0.5, 0.8, 0.2, 0.7, 0.3, 0.9, 0.1, 0.4, 0.6],
-    ]
+    ], dtype=STATE_DTYPE)
     
     for i, pattern in enumerate(patterns):
         system['neural_net'].stimulate_inputs(pattern)
@@ -7,17 +7,22 @@ Tests complete wetware-to-chatbot pipeline
 import sys
 import os
 
+import numpy as np
+
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
+from wetware.organoid_core import OrganoidCore
+from wetware.mea_interface import MEAInterface
+from wetware.life_support import LifeSupport
+from database.connection_manager import DatabaseManager
+from ai.neural.bio_neural_network import BioNeuralNetwork
+from ai.learning.reinforcement_learner import ReinforcementLearner
+
 def test_wetware_integration():
     """Test complete wetware processing pipeline"""
     print("Testing Wetware Integration Pipeline...")
     
-    from wetware.organoid_core import OrganoidCore
-    from wetware.mea_interface import MEAInterface
-    from wetware.life_support import LifeSupport
-    
     # Initialize components
     life_support = LifeSupport()
     assert life_support.initialize(), "Life support init failed"
@@ -38,8 +43,8 @@ def test_wetware_integration():
     
     # 2. Encode to pulses
     pulse_pattern = mea.encode_digital_to_pulse(digital_signal)
-    assert 'pulses' in pulse_pattern, "Pulse encoding failed"
-    assert len(pulse_pattern['pulses']) > 0, "No pulses generated"
+    assert 'pulse_timestamps' in pulse_pattern, "Pulse encoding failed"
+    assert len(pulse_pattern['pulse_timestamps']) > 0, "No pulses generated"
     
     # 3. Process through organoid
     stimulus = {
@@ -63,7 +68,7 @@ def test_wetware_integration():
     assert viability > 0.5, f"Low viability: {viability}"
     
     print("✓ Complete wetware pipeline working")
-    print(f"  - Pulses generated: {len(pulse_pattern['pulses'])}")
+    print(f"  - Pulses generated: {len(pulse_pattern['pulse_timestamps'])}")
     print(f"  - Spikes produced: {len(response['spikes'])}")
     print(f"  - Confidence: {response['confidence']:.2f}")
     print(f"  - Viability: {viability:.2f}")
@@ -74,8 +79,6 @@ def test_database_integration():
     """Test database with wetware data storage"""
     print("\nTesting Database Integration...")
     
-    from database.connection_manager import DatabaseManager
-    
     db = DatabaseManager(db_type="memory")
     
     # Get connection and store data
@@ -110,9 +113,6 @@ def test_neural_wetware_integration():
     """Test neural network with wetware"""
     print("\nTesting Neural-Wetware Integration...")
     
-    from ai.neural.bio_neural_network import BioNeuralNetwork
-    from wetware.organoid_core import OrganoidCore
-    
     # Create small network
     net = BioNeuralNetwork("integration_test")
     input_layer = net.create_layer(5, "input")
@@ -152,8 +152,6 @@ def test_reinforcement_integration():
     """Test RL with wetware feedback"""
     print("\nTesting Reinforcement Learning Integration...")
     
-    from ai.learning.reinforcement_learner import ReinforcementLearner
-    
     rl = ReinforcementLearner(state_dim=5, action_dim=3)
     
     # Simulate wetware feedback loop
@@ -182,11 +180,6 @@ def test_complete_pipeline():
     """Test complete message->wetware->response pipeline"""
     print("\nTesting Complete Pipeline...")
     
-    from wetware.organoid_core import OrganoidCore
-    from wetware.mea_interface import MEAInterface
-    from wetware.life_support import LifeSupport
-    from database.connection_manager import DatabaseManager
-    
     # Initialize all components
     life_support = LifeSupport()
     life_support.initialize()
@@ -210,12 +203,13 @@ def test_complete_pipeline():
     pulse_pattern = mea.encode_digital_to_pulse(digital_signal)
     
     # Process through all lobes
-    all_spikes = []
+    spike_trains = []
     for org in organoids:
         stimulus = {'type': 'pattern', 'intensity': 0.7, 'data': pulse_pattern}
         response = org.process_stimulus(stimulus)
-        all_spikes.extend(response['spikes'])
+        spike_trains.append(response['spikes'])
         org.apply_feedback(reward=True, intensity=0.5)
+    all_spikes = np.concatenate(spike_trains)
     
     # Decode
     decoded = mea.decode_spike_train(all_spikes)
@@ -0,0 +1,37 @@
+"""
+Thalos Prime v3.0 - Unit Tests for Life Support
+
+Tests for life support status caching
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from wetware.life_support import LifeSupport
+
+
+def test_status_reflects_direct_assignment():
+    """Test that assigning a field outside the class refreshes the cached status"""
+    life_support = LifeSupport()
+    assert life_support.initialize()
+    status = life_support.get_status()
+    assert status["safety_status"] == "SAFE"
+    assert life_support.get_status() is status
+
+    life_support.temperature = 45.0
+    status = life_support.get_status()
+    assert status["temperature"] == 45.0
+    assert status["safety_status"] == "CRITICAL"
+
+    life_support.temperature = 37.0
+    life_support.glucose_max = 4.0
+    assert life_support.get_status()["safety_status"] == "CRITICAL"
+
+    print("✓ Status cache invalidation test passed")
+
+
+if __name__ == '__main__':
+    print("Running Life Support Unit Tests...")
+    test_status_reflects_direct_assignment()
+    print("\nAll Life Support tests passed!")
@@ -0,0 +1,52 @@
+"""
+Thalos Prime v3.0 - Unit Tests for MEA Interface
+
+Tests for MEA interface status reporting
+"""
+
+import sys
+import os
+import numpy as np
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from wetware.mea_interface import MEAInterface, UNKNOWN_REGION
+
+
+def test_status_reflects_direct_changes():
+    """Test that status follows assignments and buffer drains from outside the class"""
+    mea = MEAInterface(channels=100)
+    assert mea.initialize()
+    assert mea.get_status()["active"] is True
+
+    mea.packet_loss_rate = 0.2
+    assert mea.get_status()["packet_loss_rate"] == 0.2
+
+    mea.transmit_pulse_pattern(mea.build_pulse_pattern({"type": "query", "intensity": 0.5}))
+    assert mea.get_status()["input_buffer_size"] == 1
+    mea.input_buffer.popleft()
+    assert mea.get_status()["input_buffer_size"] == 0
+
+    mea.active = False
+    assert mea.get_status()["active"] is False
+
+    print("✓ Status direct change test passed")
+
+
+def test_float_channel_ids():
+    """Test that integral float channel IDs map to the same region as ints"""
+    mea = MEAInterface(channels=100)
+    mea.initialize()
+    
+    assert mea._region_id(5.0) == mea._region_id(5)
+    assert mea._region_id(np.float64(60.0)) == mea._region_id(60)
+    assert mea._region_id(5.5) == UNKNOWN_REGION
+    assert mea._region_id(float('nan')) == UNKNOWN_REGION
+    
+    print("✓ Float channel ID test passed")
+
+
+if __name__ == '__main__':
+    print("Running MEA Interface Unit Tests...")
+    test_status_reflects_direct_changes()
+    test_float_channel_ids()
+    print("\nAll MEA Interface tests passed!")
@@ -36,6 +36,25 @@ def test_crud_create():
     print("✓ CRUD Create test passed")
 
 
+def test_crud_create_many():
+    """Test bulk Create operation (explicit CRUD)"""
+    memory = MemoryModule()
+    
+    # Successful bulk create
+    result = memory.create_many({'key1': 'value1', 'key2': 'value2'})
+    assert result is True
+    assert memory.read('key1') == 'value1'
+    assert memory.read('key2') == 'value2'
+    
+    # Any existing key fails the whole batch
+    result = memory.create_many({'key2': 'other', 'key3': 'value3'})
+    assert result is False
+    assert memory.read('key2') == 'value2'
+    assert memory.exists('key3') is False
+    
+    print("✓ CRUD Create many test passed")
+
+
 def test_crud_read():
     """Test Read operation (explicit CRUD)"""
     memory = MemoryModule()
@@ -52,6 +71,23 @@ def test_crud_read():
     print("✓ CRUD Read test passed")
 
 
+def test_read_all():
+    """Test reading every entry at once"""
+    memory = MemoryModule()
+    assert memory.read_all() == {}
+    
+    memory.create('key1', 'value1')
+    memory.create('key2', {'nested': 'data'})
+    entries = memory.read_all()
+    assert entries == {'key1': 'value1', 'key2': {'nested': 'data'}}
+    
+    # Result is a copy of storage, not a live view
+    entries['key3'] = 'value3'
+    assert memory.exists('key3') is False
+    
+    print("✓ Read all test passed")
+
+
 def test_crud_update():
     """Test Update operation (explicit CRUD)"""
     memory = MemoryModule()
@@ -247,12 +283,68 @@ def test_persistence():
         if os.path.exists(temp_path):
             os.remove(temp_path)
 
+def test_persistence_round_trip_matches_json():
+    """Test that snapshots round-trip like json.dump with and without orjson"""
+    import json
+    import math
+    import tempfile
+    from core.memory import storage
+    
+    values = {
+        'text': 'caf\u00e9 null',
+        'none': None,
+        'big': 2 ** 70,
+        'nan': float('nan'),
+        'inf': float('inf'),
+        'nested': {'list': [1, 2.5, True], 'int_keys': {1: 'one'}}
+    }
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = os.path.join(temp_dir, 'memory.json')
+        
+        # A snapshot written by plain json.dump loads back unchanged
+        with open(temp_path, 'w') as f:
+            json.dump(values, f, indent=2)
+        memory = MemoryModule(persistence_path=temp_path)
+        assert memory.read('big') == 2 ** 70
+        assert math.isnan(memory.read('nan'))
+        
+        original = storage.ORJSON_AVAILABLE
+        try:
+            for backend in {original, False}:
+                storage.ORJSON_AVAILABLE = backend
+                memory1 = MemoryModule(persistence_path=temp_path)
+                memory1.clear()
+                memory1.create_many(values)
+                assert memory1.save_to_disk() is True
+                
+                memory2 = MemoryModule(persistence_path=temp_path)
+                loaded = memory2.read_all()
+                assert math.isnan(loaded.pop('nan'))
+                expected = dict(values, nested={'list': [1, 2.5, True], 'int_keys': {'1': 'one'}})
+                del expected['nan']
+                assert loaded == expected
+                assert isinstance(loaded['big'], int)
+                
+                # Without special values orjson writes the same layout as json.dump
+                memory1.clear()
+                memory1.create_many({'a': [1, 2], 'b': {'c': 'd'}})
+                assert memory1.save_to_disk() is True
+                with open(temp_path) as f:
+                    assert f.read() == json.dumps({'a': [1, 2], 'b': {'c': 'd'}}, indent=2)
+        finally:
+            storage.ORJSON_AVAILABLE = original
+    
+    print("✓ Persistence round-trip test passed")
+
 
 if __name__ == '__main__':
     print("Running Memory Module Unit Tests...")
     test_memory_initialization()
     test_crud_create()
+    test_crud_create_many()
     test_crud_read()
+    test_read_all()
     test_crud_update()
     test_crud_delete()
     test_exists()
@@ -262,4 +354,5 @@ if __name__ == '__main__':
     test_deterministic_behavior()
     test_no_side_effects()
     test_persistence()
+    test_persistence_round_trip_matches_json()
     print("\nAll Memory Module tests passed!")
@@ -0,0 +1,77 @@
+"""
+Thalos Prime v3.0 - Unit Tests for Organoid Core
+
+Tests for spike-timing-dependent plasticity in the organoid simulation
+"""
+
+import sys
+import os
+import math
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+import numpy as np
+
+from wetware.organoid_core import OrganoidCore, SPIKE_DTYPE
+
+
+def _spike_train(timestamps):
+    """Build a spike train record array from window-relative timestamps"""
+    spikes = np.zeros(len(timestamps), dtype=SPIKE_DTYPE)
+    spikes["timestamp"] = timestamps
+    return spikes
+
+
+def _pairwise_stdp_delta(pre_times, post_times, window_start, window_posts):
+    """Weight change for one window by explicit all-to-all pair summation"""
+    cls = OrganoidCore
+    # LTD: the new presynaptic event against every earlier postsynaptic spike
+    delta = -cls.STDP_A_MINUS * sum(
+        math.exp(-(window_start - post) / cls.STDP_TAU_MINUS) for post in post_times)
+    # LTP: each new postsynaptic spike against every presynaptic event so far
+    for post in window_posts:
+        delta += cls.STDP_A_PLUS * sum(
+            math.exp(-(post - pre) / cls.STDP_TAU_PLUS) for pre in pre_times if pre <= post)
+    return delta
+
+
+def test_stdp_matches_pairwise_summation():
+    """Test trace-based STDP against brute-force pair summation"""
+    organoid = OrganoidCore("stdp_test", "logic")
+    organoid.initialize()
+    weight_key = organoid._primary_weight_key
+    
+    windows = [
+        [0.0, 12.5, 40.0],
+        [],
+        [5.0, 95.0],
+        [30.0, 31.0, 32.0, 60.0],
+        [99.0],
+    ]
+    
+    pre_times = []
+    post_times = []
+    for index, window in enumerate(windows):
+        window_start = index * OrganoidCore.STDP_WINDOW_MS
+        window_posts = [window_start + t for t in window]
+        pre_times.append(window_start)
+        expected = _pairwise_stdp_delta(pre_times, post_times, window_start, window_posts)
+        post_times.extend(window_posts)
+        
+        before = organoid.synaptic_weights[weight_key]
+        if window:
+            ltp_sum, post_sum = OrganoidCore._stdp_sums(_spike_train(window))
+        else:
+            ltp_sum, post_sum = 0.0, 0.0
+        organoid._apply_stdp("pattern", ltp_sum, post_sum)
+        actual = organoid.synaptic_weights[weight_key] - before
+        
+        assert math.isclose(actual, expected, rel_tol=1e-6, abs_tol=1e-12), \
+            f"window {index}: {actual} != {expected}"
+    
+    print("✓ STDP pair summation test passed")
+
+
+if __name__ == '__main__':
+    print("Running Organoid Core Unit Tests...")
+    test_stdp_matches_pairwise_summation()
+    print("\nAll Organoid Core tests passed!")
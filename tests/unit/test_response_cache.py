@@ -0,0 +1,72 @@
+"""
+Thalos Prime v3.0 - Unit Tests for Response Cache
+
+Tests for the chat response cache
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from interfaces.web.response_cache import ResponseCache
+
+
+def test_lru_eviction():
+    """Test that the least recently used entry is evicted first"""
+    cache = ResponseCache(maxsize=2)
+    cache.put("first", {"response": 1})
+    cache.put("second", {"response": 2})
+    assert cache.get("first") == {"response": 1}
+
+    cache.put("third", {"response": 3})
+    assert cache.get("second") is None
+    assert cache.get("first") == {"response": 1}
+    assert cache.get("third") == {"response": 3}
+    assert cache.get_statistics()["size"] == 2
+
+    print("✓ LRU eviction test passed")
+
+
+def test_sync_state_invalidates():
+    """Test that a state change drops every cached entry"""
+    cache = ResponseCache(maxsize=4)
+    cache.sync_state("optimal")
+    cache.put("hello", {"response": "hi"})
+
+    cache.sync_state("optimal")
+    assert cache.get("hello") == {"response": "hi"}
+
+    cache.sync_state("warning")
+    assert cache.get("hello") is None
+    cache.put("hello", {"response": "hi again"})
+    assert cache.get("hello") == {"response": "hi again"}
+
+    print("✓ State invalidation test passed")
+
+
+def test_exact_hits_only_by_default():
+    """Test that a near-duplicate message is not served another message's payload"""
+    cache = ResponseCache(maxsize=4)
+    cache.put("what is the weather today", {"response": "sunny"})
+    assert cache.get("what is the weather today?") is None
+
+    print("✓ Exact-only lookup test passed")
+
+
+def test_zero_maxsize_disables_cache():
+    """Test that maxsize=0 stores nothing instead of raising"""
+    cache = ResponseCache(maxsize=0)
+    cache.put("hello", {"response": "hi"})
+    assert cache.get("hello") is None
+    assert cache.get_statistics()["size"] == 0
+
+    print("✓ Zero maxsize test passed")
+
+
+if __name__ == '__main__':
+    print("Running Response Cache Unit Tests...")
+    test_lru_eviction()
+    test_sync_state_invalidates()
+    test_exact_hits_only_by_default()
+    test_zero_maxsize_disables_cache()
+    print("\nAll Response Cache tests passed!")
@@ -11,6 +11,7 @@ Complete system initialization and orchestration
 import sys
 import os
 import argparse
+import importlib.util
 import signal
 from typing import Optional
 
@@ -20,32 +21,11 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 # Core imports
 from core.cis import CIS
 
-# Wetware imports
-try:
-    from wetware.organoid_core import OrganoidCore
-    from wetware.mea_interface import MEAInterface
-    from wetware.life_support import LifeSupport
-    WETWARE_AVAILABLE = True
-except ImportError as e:
-    print(f"Warning: Wetware components not fully available: {e}")
-    WETWARE_AVAILABLE = False
-
-# AI imports
-try:
-    from ai.neural.bio_neural_network import BioNeuralNetwork
-    from ai.learning.reinforcement_learner import ReinforcementLearner
-    AI_AVAILABLE = True
-except ImportError as e:
-    print(f"Warning: AI components not fully available: {e}")
-    AI_AVAILABLE = False
-
-# Database imports
-try:
-    from database.connection_manager import DatabaseManager
-    DATABASE_AVAILABLE = True
-except ImportError as e:
-    print(f"Warning: Database components not fully available: {e}")
-    DATABASE_AVAILABLE = False
+# Optional subsystems are imported by their _initialize_* methods, so
+# --help and runs with a subsystem disabled never load it (or NumPy)
+WETWARE_AVAILABLE = importlib.util.find_spec('wetware') is not None
+AI_AVAILABLE = importlib.util.find_spec('ai') is not None
+DATABASE_AVAILABLE = importlib.util.find_spec('database') is not None
 
 # Interface imports
 from interfaces.cli import CLI
@@ -160,6 +140,10 @@ class ThalosPrime:
     def _initialize_wetware(self) -> bool:
         """Initialize wetware components"""
         try:
+            from wetware.organoid_core import OrganoidCore
+            from wetware.mea_interface import MEAInterface
+            from wetware.life_support import LifeSupport
+            
             # Initialize Life Support
             self.life_support = LifeSupport()
             if not self.life_support.initialize():
@@ -186,6 +170,9 @@ class ThalosPrime:
     def _initialize_ai(self) -> bool:
         """Initialize AI systems"""
         try:
+            from ai.neural.bio_neural_network import BioNeuralNetwork
+            from ai.learning.reinforcement_learner import ReinforcementLearner
+            
             # Create Bio-inspired Neural Network
             self.neural_network = BioNeuralNetwork("thalos_main")
             
@@ -216,6 +203,8 @@ class ThalosPrime:
     def _initialize_database(self, db_config: dict) -> bool:
         """Initialize database manager"""
         try:
+            from database.connection_manager import DatabaseManager
+            
             db_type = db_config.get('type', 'memory')
             self.db_manager = DatabaseManager(db_type=db_type, config=db_config)
             return True
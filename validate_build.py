@@ -18,6 +18,13 @@ print("© 2026 Tony Ray Macier III. All rights reserved.")
 print("="*70 + "\n")
 
 validation_results = []
+categories = {}
+category_results = []
+
+def begin_category(name):
+    """Summarize the requirements validated from here on under a category"""
+    global category_results
+    category_results = categories.setdefault(name, [])
 
 def validate_requirement(name, check_func):
     """Validate a requirement"""
@@ -25,16 +32,19 @@ def validate_requirement(name, check_func):
         result = check_func()
         status = "✓ PASS" if result else "✗ FAIL"
         validation_results.append((name, result))
+        category_results.append((name, result))
         print(f"{status} - {name}")
         return result
     except Exception as e:
         print(f"✗ FAIL - {name}: {e}")
         validation_results.append((name, False))
+        category_results.append((name, False))
         return False
 
 
 print("1. VALIDATING CORE REQUIREMENTS")
 print("-" * 70)
+begin_category("Core Requirements")
 
 def check_github_actions_updated():
     """Verify GitHub Actions updated to v4"""
@@ -75,6 +85,7 @@ validate_requirement("Data persistence implemented", check_data_persistence)
 
 print("\n2. VALIDATING WETWARE COMPONENTS")
 print("-" * 70)
+begin_category("Wetware Components")
 
 def check_wetware_core():
     """Verify wetware core components"""
@@ -145,6 +156,7 @@ validate_requirement("Life support homeostasis", check_life_support_homeostasis)
 
 print("\n3. VALIDATING DATABASE INTEGRATION")
 print("-" * 70)
+begin_category("Database Integration")
 
 def check_database_auto_reconnect():
     """Verify database auto-reconnection"""
@@ -183,6 +195,7 @@ validate_requirement("Database shared storage", check_database_shared_storage)
 
 print("\n4. VALIDATING CHATBOT CAPABILITIES")
 print("-" * 70)
+begin_category("Chatbot Capabilities")
 
 def check_nlp_processor():
     """Verify NLP processor"""
@@ -295,6 +308,7 @@ validate_requirement("Knowledge base (7+ domains)", check_knowledge_base)
 
 print("\n5. VALIDATING WEB INTERFACE")
 print("-" * 70)
+begin_category("Web Interface")
 
 def check_matrix_interface():
     """Verify Matrix-style interface files"""
@@ -325,6 +339,7 @@ validate_requirement("Neural activity visualizer", check_neural_visualizer)
 
 print("\n6. VALIDATING AUTO-DEPLOYMENT")
 print("-" * 70)
+begin_category("Auto-Deployment")
 
 def check_auto_deploy_scripts():
     """Verify auto-deployment scripts"""
@@ -346,6 +361,7 @@ validate_requirement("Scripts are executable", check_deploy_script_executable)
 
 print("\n7. VALIDATING DOCUMENTATION")
 print("-" * 70)
+begin_category("Documentation")
 
 def check_documentation():
     """Verify documentation files"""
@@ -355,26 +371,31 @@ def check_documentation():
 def check_copyright_notices():
     """Verify copyright in all Python files"""
     import glob
-    python_files = glob.glob('src/**/*.py', recursive=True)
-    python_files.extend(glob.glob('*.py'))
+    import itertools
+    # Walk lazily so the tree is only listed as far as the first 20 files
+    python_files = itertools.chain(glob.iglob('src/**/*.py', recursive=True),
+                                   glob.iglob('*.py'))
     
     checked = 0
-    for file in python_files[:20]:  # Check first 20
+    for file in itertools.islice(python_files, 20):  # Check first 20
         try:
             with open(file, 'r') as f:
                 content = f.read()
                 if 'Tony Ray Macier III' in content:
                     checked += 1
+                    if checked > 10:
+                        return True
         except:
             pass
     
-    return checked > 10
+    return False
 
 validate_requirement("Complete documentation", check_documentation)
 validate_requirement("Copyright notices in source files", check_copyright_notices)
 
 print("\n8. VALIDATING TEST COVERAGE")
 print("-" * 70)
+begin_category("Test Coverage")
 
 def check_test_files():
     """Verify all test files exist"""
@@ -396,6 +417,7 @@ validate_requirement("Tests are executable", check_test_executability)
 
 print("\n9. VALIDATING AI/ML CAPABILITIES")
 print("-" * 70)
+begin_category("AI/ML Capabilities")
 
 def check_neural_network():
     """Verify bio neural network"""
@@ -451,6 +473,7 @@ validate_requirement("STDP learning in organoids", check_stdp_learning)
 
 print("\n10. VALIDATING LEGAL FRAMEWORK")
 print("-" * 70)
+begin_category("Legal Framework")
 
 def check_license_file():
     """Verify proprietary license"""
@@ -478,19 +501,6 @@ print("\n" + "="*70)
 print("VALIDATION SUMMARY")
 print("="*70)
 
-categories = {
-    "Core Requirements": validation_results[0:4],
-    "Wetware Components": validation_results[4:8],
-    "Database Integration": validation_results[8:10],
-    "Chatbot Capabilities": validation_results[10:14],
-    "Web Interface": validation_results[14:17],
-    "Auto-Deployment": validation_results[17:19],
-    "Documentation": validation_results[19:21],
-    "Test Coverage": validation_results[21:23],
-    "AI/ML Capabilities": validation_results[23:26],
-    "Legal Framework": validation_results[26:29],
-}
-
 all_passed = True
 for category, results in categories.items():
     passed = sum(1 for _, r in results if r)